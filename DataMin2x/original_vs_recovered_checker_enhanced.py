@@ -6,15 +6,283 @@ Orijinal veri seti ile kurtarılan backup verilerini karşılaştırır
 ENHANCED: Daha detaylı progress raporları ve gerçek zamanlı istatistikler
 """
 
+import bisect
+import functools
+import gc
 import json
 import hashlib
+import multiprocessing
 import os
+import re
+import sys
 import time
 import psutil
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from typing import List, Dict, Set, Tuple
 from difflib import SequenceMatcher
 
+try:
+    import orjson  # Rust tabanlı, büyük dosyalarda json'dan kat kat hızlı
+except ImportError:
+    orjson = None  # Fallback: stdlib json
+
+try:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+except ImportError:
+    TfidfVectorizer = None  # Fallback: SequenceMatcher tabanlı tarama
+
+try:
+    from sparse_dot_topn import awesome_cossim_topn
+except ImportError:
+    awesome_cossim_topn = None  # Fallback: scipy sparse çarpım
+
+
+def _read_json_file(file_path: str):
+    """JSON dosyası oku (varsa orjson ile)"""
+    if orjson is not None:
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json_file(data, file_path: str):
+    """JSON dosyası yaz (varsa orjson ile, 2 boşluk girintili)"""
+    if orjson is not None:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+# Citation temizleme pattern'i (benzerlik hesabında kullanılır)
+_CITE_PATTERN = re.compile(r'\[cite[:\s]*\d+[,\s\d]*\]')
+_CITE_START_PATTERN = re.compile(r'\[cite_start\]')
+_NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+
+
+@functools.lru_cache(maxsize=None)
+def _qa_hash(soru: str, cevap: str) -> str:
+    """Ön işlenmiş (strip/lower) metin çifti için exact hash - memoized
+
+    Augmented veride aynı yüzey formu defalarca geçer; lru_cache tekrar
+    eden MD5 hesabını tek çağrıya indirir.
+    """
+    return hashlib.md5(f"{soru}|{cevap}".encode('utf-8')).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _content_fingerprint(soru: str, cevap: str) -> str:
+    """İçerik fingerprint'i (citation ve noktalama hariç) - memoized"""
+    cevap = _CITE_PATTERN.sub('', cevap)
+    cevap = _CITE_START_PATTERN.sub('', cevap)
+
+    soru = _NON_WORD_PATTERN.sub('', soru)
+    cevap = _NON_WORD_PATTERN.sub('', cevap)
+
+    return hashlib.md5(f"{soru}|{cevap}".encode('utf-8')).hexdigest()
+
+# Worker process durumu (her worker'da _init_similarity_worker ile doldurulur)
+# SoA düzeni: dict listesi yerine paralel soru/cevap listeleri (cache dostu,
+# hot loop'ta dict lookup yok)
+_worker_orig_sorular: List[str] = []
+_worker_orig_cevaplar: List[str] = []
+_worker_threshold: float = 0.85
+# Cevap uzunluğuna göre sıralı index: (uzunluk, orijinal index)
+_worker_len_keys: List[int] = []
+_worker_len_order: List[int] = []
+# Kelime -> orijinal index posting listeleri (blocking için)
+_worker_postings: Dict[str, List[int]] = {}
+_worker_df_limit: int = 0
+# Token bitset imzaları (Jaccard ön filtresi için)
+_worker_bitsets: List[int] = []
+
+_BITSET_MASK = 0x3FFF  # 14-bit token hash alanı (16384 bit / imza)
+_JACCARD_FLOOR = 0.3   # Bunun altındaki token-Jaccard çiftleri DP'ye girmez
+
+
+def _token_bitset(text: str) -> int:
+    """Metnin token kümesini 16384-bit'lik tek bir int imzaya paketle
+
+    Jaccard ~ popcount(a & b) / popcount(a | b); Python int'in bitwise
+    işlemleri ve bit_count() C seviyesinde çalışır, DP'den çok ucuzdur.
+    """
+    bits = 0
+    for tok in text.split():
+        bits |= 1 << (hash(tok) & _BITSET_MASK)
+    return bits
+
+
+def _preprocess_qa_texts(data: List[Dict]) -> Tuple[List[str], List[str]]:
+    """Q&A dict listesini SoA düzenine çevir (paralel soru/cevap listeleri)
+
+    Strip/lower ve citation temizliği burada bir kez yapılır; hot loop
+    artık hazır string'ler üzerinde çalışır. Orijinal dict'ler çıktı için
+    index üzerinden korunur.
+    """
+    sorular = [qa.get('soru', '').strip().lower() for qa in data]
+    cevaplar = [_CITE_PATTERN.sub('', qa.get('cevap', '').strip().lower()) for qa in data]
+    return sorular, cevaplar
+
+
+def _text_similarity(soru1: str, cevap1: str, soru2: str, cevap2: str,
+                     threshold: float = 0.0) -> float:
+    """Ön işlenmiş metinler üzerinde ağırlıklı benzerlik (soru %40, cevap %60)
+
+    threshold > 0 verilirse difflib'in dokümante ucuz üst sınırları
+    (real_quick_ratio O(1), quick_ratio O(n)) ile pahalı ratio() DP'si
+    gate'lenir: threshold'a matematiksel olarak ulaşamayacak çiftlerde
+    erken dönülür (dönen değer gerçek skorun alt sınırıdır).
+    """
+    sm_soru = SequenceMatcher(None, soru1, soru2)
+
+    if threshold > 0.0:
+        # Soru bileşeni alt sınırı: t = 0.4*s + 0.6*c, c <= 1 iken
+        soru_floor = (threshold - 0.6) / 0.4
+        if sm_soru.real_quick_ratio() < soru_floor or sm_soru.quick_ratio() < soru_floor:
+            return 0.0
+
+    soru_similarity = sm_soru.ratio()
+    sm_cevap = SequenceMatcher(None, cevap1, cevap2)
+
+    if threshold > 0.0:
+        # Cevap bileşeni alt sınırı, artık s bilinirken
+        cevap_floor = (threshold - 0.4 * soru_similarity) / 0.6
+        if sm_cevap.real_quick_ratio() < cevap_floor or sm_cevap.quick_ratio() < cevap_floor:
+            return soru_similarity * 0.4
+
+    cevap_similarity = sm_cevap.ratio()
+    return (soru_similarity * 0.4) + (cevap_similarity * 0.6)
+
+
+def _calculate_similarity(qa1: Dict, qa2: Dict) -> float:
+    """İki Q&A çifti arasında benzerlik hesapla (dict API'si)"""
+    return _text_similarity(
+        qa1.get('soru', '').strip().lower(),
+        _CITE_PATTERN.sub('', qa1.get('cevap', '').strip().lower()),
+        qa2.get('soru', '').strip().lower(),
+        _CITE_PATTERN.sub('', qa2.get('cevap', '').strip().lower())
+    )
+
+
+def _init_similarity_worker(orig_sorular: List[str], orig_cevaplar: List[str], threshold: float):
+    """Worker process başlangıcı - orijinal metinler fork/spawn ile bir kez aktarılır"""
+    global _worker_orig_sorular, _worker_orig_cevaplar, _worker_threshold
+    global _worker_len_keys, _worker_len_order
+    _worker_orig_sorular = orig_sorular
+    _worker_orig_cevaplar = orig_cevaplar
+    _worker_threshold = threshold
+
+    global _worker_postings, _worker_df_limit
+
+    # Uzunluk ön filtresi: ratio() üst sınırı 2*min(len)/(len1+len2) olduğundan
+    # cevap uzunluğu pencere dışında kalan orijinaller threshold'u asla geçemez
+    len_index = sorted((len(c), j) for j, c in enumerate(orig_cevaplar))
+    _worker_len_keys = [t[0] for t in len_index]
+    _worker_len_order = [t[1] for t in len_index]
+
+    # Inverted index: her kelime için o kelimeyi içeren orijinallerin listesi.
+    # Nadir token'ların posting birleşimi aday kümesini |original|'in çok
+    # küçük bir kesrine indirir (klasik blocking)
+    postings: Dict[str, List[int]] = {}
+    for j in range(len(orig_sorular)):
+        for tok in set(f"{orig_sorular[j]} {orig_cevaplar[j]}".split()):
+            postings.setdefault(tok, []).append(j)
+    _worker_postings = postings
+    _worker_df_limit = max(1, int(0.1 * len(orig_sorular)))
+
+    global _worker_bitsets
+    _worker_bitsets = [_token_bitset(f"{orig_sorular[j]} {orig_cevaplar[j]}")
+                       for j in range(len(orig_sorular))]
+
+
+def _length_window(length: int, cevap_bound: float) -> Tuple[int, int]:
+    """Cevap uzunluğu L için threshold'u geçebilecek [lo, hi] uzunluk aralığı"""
+    factor = cevap_bound / (2.0 - cevap_bound)
+    return int(length * factor), int(length / factor) if factor > 0 else (1 << 30)
+
+
+def _similarity_worker(recovered_texts: Tuple[str, str]) -> Tuple[bool, int, float, int, float, float, float]:
+    """Tek bir recovered item'ı tüm orijinallerle karşılaştır
+
+    Dönüş: (is_similar, best_index (-1 = yok), max_similarity,
+            karşılaştırma sayısı, lokal min, lokal maks, lokal toplam)
+
+    Hot path'te running max/best takibi yok: best index sadece threshold
+    aşıldığında (is_similar) raporlandığı için eşleşme anında döneriz.
+    """
+    rec_soru, rec_cevap = recovered_texts
+    local_min = 1.0
+    local_max = 0.0
+    local_sum = 0.0
+    comparisons = 0
+
+    orig_sorular = _worker_orig_sorular
+    orig_cevaplar = _worker_orig_cevaplar
+    threshold = _worker_threshold
+
+    # Uzunluk penceresi: soru %40 ağırlıklı olduğundan threshold'u geçmek
+    # için cevap benzerliği en az (t - 0.4) / 0.6 olmalı
+    cevap_bound = max(0.0, (threshold - 0.4) / 0.6)
+    ls1 = len(rec_soru)
+    lc1 = len(rec_cevap)
+
+    # Önce inverted index'ten aday üret: nadir token paylaşmayan
+    # orijinallerin threshold'u geçme şansı pratikte yok
+    candidate_ids: Set[int] = set()
+    has_rare_token = False
+    for tok in set(f"{rec_soru} {rec_cevap}".split()):
+        posting = _worker_postings.get(tok)
+        if posting is not None and len(posting) < _worker_df_limit:
+            has_rare_token = True
+            candidate_ids.update(posting)
+
+    if has_rare_token:
+        candidates = candidate_ids
+    elif _worker_len_keys and cevap_bound > 0 and lc1 > 0:
+        # Nadir token yoksa uzunluk penceresindeki tüm orijinalleri tara
+        lo, hi = _length_window(lc1, cevap_bound)
+        start = bisect.bisect_left(_worker_len_keys, lo)
+        end = bisect.bisect_right(_worker_len_keys, hi)
+        candidates = _worker_len_order[start:end]
+    else:
+        candidates = range(len(orig_sorular))
+
+    rec_bits = _token_bitset(f"{rec_soru} {rec_cevap}")
+
+    for j in candidates:
+        # O(1) birleşik üst sınır: uzunluklardan türeyen maksimum skor
+        ls2 = len(orig_sorular[j])
+        lc2 = len(orig_cevaplar[j])
+        upper_bound = (0.4 * (2.0 * min(ls1, ls2) / ((ls1 + ls2) or 1)) +
+                       0.6 * (2.0 * min(lc1, lc2) / ((lc1 + lc2) or 1)))
+        if upper_bound < threshold:
+            continue
+
+        # Token-Jaccard ön filtresi: bitset popcount, O(n*m) DP'den çok ucuz
+        orig_bits = _worker_bitsets[j]
+        union = (rec_bits | orig_bits).bit_count()
+        if union and (rec_bits & orig_bits).bit_count() / union < _JACCARD_FLOOR:
+            continue
+
+        similarity = _text_similarity(rec_soru, rec_cevap, orig_sorular[j], orig_cevaplar[j],
+                                      threshold)
+        comparisons += 1
+        local_sum += similarity
+
+        if similarity > local_max:
+            local_max = similarity
+        if similarity < local_min:
+            local_min = similarity
+
+        if similarity >= threshold:
+            return True, j, similarity, comparisons, local_min, local_max, local_sum
+
+    return False, -1, 0.0, comparisons, local_min, local_max, local_sum
+
+
 class EnhancedOriginalVsRecoveredChecker:
     """Gelişmiş orijinal ve kurtarılan veri karşılaştırma sınıfı"""
     
@@ -30,11 +298,16 @@ class EnhancedOriginalVsRecoveredChecker:
             'current_max_similarity': 0,
             'current_min_similarity': 1.0,
             'avg_similarity_so_far': 0,
-            'similarities_found': []
+            'similarity_count': 0,
+            'similarity_sum': 0.0
         }
         self.similarity_threshold = 0.85  # %85 benzerlik
         self.progress_update_frequency = 250  # Her 250 item'da bir update
         self.detailed_update_frequency = 50   # Her 50 item'da bir detaylı update
+        self.worker_count = os.cpu_count() or 1  # Benzerlik analizi için process sayısı
+        self.parallel_min_items = 100  # Bundan az item için multiprocessing'e değmez
+        self._proc = psutil.Process()  # Handle'ı cache'le, her çağrıda yeniden oluşturma
+        self.verbose = 1  # 0: sessiz, 1: periyodik progress, 2: detaylı raporlar
         
     def log(self, message: str, level: str = "INFO"):
         """Gelişmiş log mesajı"""
@@ -46,11 +319,13 @@ class EnhancedOriginalVsRecoveredChecker:
         timestamp = datetime.now().strftime("%H:%M:%S")
         print(f"\n🔄 [{timestamp}] {message}")
         
-    def get_memory_usage(self) -> str:
-        """Mevcut bellek kullanımını al"""
-        process = psutil.Process()
-        memory_mb = process.memory_info().rss / 1024 / 1024
-        return f"{memory_mb:.1f}MB"
+    def get_memory_usage(self) -> float:
+        """Mevcut bellek kullanımını MB olarak al"""
+        return self._proc.memory_info().rss / 1048576
+
+    def get_memory_usage_str(self) -> str:
+        """Bellek kullanımını log için formatla"""
+        return f"{self.get_memory_usage():.1f}MB"
         
     def calculate_eta(self, processed: int, total: int, start_time: float) -> str:
         """Tahmini kalan süreyi hesapla"""
@@ -73,62 +348,38 @@ class EnhancedOriginalVsRecoveredChecker:
         """Q&A çifti için exact hash"""
         soru = qa_pair.get('soru', '').strip().lower()
         cevap = qa_pair.get('cevap', '').strip().lower()
-        text = f"{soru}|{cevap}"
-        return hashlib.md5(text.encode('utf-8')).hexdigest()
-        
+        return _qa_hash(soru, cevap)
+
     def get_content_fingerprint(self, qa_pair: Dict) -> str:
         """İçerik için daha esnek fingerprint (citation'lar hariç)"""
         soru = qa_pair.get('soru', '').strip().lower()
         cevap = qa_pair.get('cevap', '').strip().lower()
-        
-        # Citation'ları temizle
-        import re
-        cevap = re.sub(r'\[cite[:\s]*\d+[,\s\d]*\]', '', cevap)
-        cevap = re.sub(r'\[cite_start\]', '', cevap)
-        
-        # Noktalama ve boşlukları normalize et
-        soru = re.sub(r'[^\w\s]', '', soru)
-        cevap = re.sub(r'[^\w\s]', '', cevap)
-        
-        text = f"{soru}|{cevap}"
-        return hashlib.md5(text.encode('utf-8')).hexdigest()
+        return _content_fingerprint(soru, cevap)
         
     def calculate_similarity(self, qa1: Dict, qa2: Dict) -> float:
         """İki Q&A çifti arasında benzerlik hesapla"""
-        soru1 = qa1.get('soru', '').strip().lower()
-        cevap1 = qa1.get('cevap', '').strip().lower()
-        
-        soru2 = qa2.get('soru', '').strip().lower()
-        cevap2 = qa2.get('cevap', '').strip().lower()
-        
-        # Soru benzerliği
-        soru_similarity = SequenceMatcher(None, soru1, soru2).ratio()
-        
-        # Cevap benzerliği (citation'lar hariç)
-        import re
-        cevap1_clean = re.sub(r'\[cite[:\s]*\d+[,\s\d]*\]', '', cevap1)
-        cevap2_clean = re.sub(r'\[cite[:\s]*\d+[,\s\d]*\]', '', cevap2)
-        
-        cevap_similarity = SequenceMatcher(None, cevap1_clean, cevap2_clean).ratio()
-        
-        # Ağırlıklı ortalama (soru %40, cevap %60)
-        overall_similarity = (soru_similarity * 0.4) + (cevap_similarity * 0.6)
-        
-        return overall_similarity
-        
+        return _calculate_similarity(qa1, qa2)
+
     def update_similarity_stats(self, similarity: float):
         """Benzerlik istatistiklerini güncelle"""
-        self.stats['similarities_found'].append(similarity)
-        
-        if similarity > self.stats['current_max_similarity']:
-            self.stats['current_max_similarity'] = similarity
-            
-        if similarity < self.stats['current_min_similarity']:
-            self.stats['current_min_similarity'] = similarity
-            
+        self.merge_similarity_stats(1, similarity, similarity, similarity)
+
+    def merge_similarity_stats(self, count: int, min_sim: float, max_sim: float, sim_sum: float):
+        """Worker'lardan gelen toplu benzerlik istatistiklerini birleştir"""
+        if count <= 0:
+            return
+
+        self.stats['similarity_count'] += count
+        self.stats['similarity_sum'] += sim_sum
+
+        if max_sim > self.stats['current_max_similarity']:
+            self.stats['current_max_similarity'] = max_sim
+
+        if min_sim < self.stats['current_min_similarity']:
+            self.stats['current_min_similarity'] = min_sim
+
         # Ortalama hesapla
-        if self.stats['similarities_found']:
-            self.stats['avg_similarity_so_far'] = sum(self.stats['similarities_found']) / len(self.stats['similarities_found'])
+        self.stats['avg_similarity_so_far'] = self.stats['similarity_sum'] / self.stats['similarity_count']
             
     def print_detailed_progress(self, current: int, total: int, start_time: float, 
                               similar_found: int, high_similarities: List[float]):
@@ -138,26 +389,33 @@ class EnhancedOriginalVsRecoveredChecker:
         eta = self.calculate_eta(current, total, start_time)
         progress_pct = (current / total) * 100
         
-        print(f"\n📊 === DETAYLI İLERLEME RAPORU ===")
-        print(f"⏱️  Süre: {elapsed:.1f}s | Hız: {rate:.1f} item/s | ETA: {eta}")
-        print(f"📈 İlerleme: {current:,}/{total:,} (%{progress_pct:.1f})")
-        print(f"🔍 Benzerlik: Maks: %{self.stats['current_max_similarity']*100:.1f} | "
-              f"Min: %{self.stats['current_min_similarity']*100:.1f} | "
-              f"Ort: %{self.stats['avg_similarity_so_far']*100:.1f}")
-        print(f"🔄 Bulunan similar: {similar_found:,} adet")
-        print(f"💾 Bellek: {self.get_memory_usage()}")
-        
+        # Satır satır print yerine tek seferde yaz: hot loop içinde her
+        # print ayrı flush/syscall tetikliyordu
+        lines = [
+            "",
+            "📊 === DETAYLI İLERLEME RAPORU ===",
+            f"⏱️  Süre: {elapsed:.1f}s | Hız: {rate:.1f} item/s | ETA: {eta}",
+            f"📈 İlerleme: {current:,}/{total:,} (%{progress_pct:.1f})",
+            f"🔍 Benzerlik: Maks: %{self.stats['current_max_similarity']*100:.1f} | "
+            f"Min: %{self.stats['current_min_similarity']*100:.1f} | "
+            f"Ort: %{self.stats['avg_similarity_so_far']*100:.1f}",
+            f"🔄 Bulunan similar: {similar_found:,} adet",
+            f"💾 Bellek: {self.get_memory_usage_str()}",
+        ]
+
         if high_similarities:
-            print(f"🎯 Son yüksek benzerlikler: {[f'%{s*100:.1f}' for s in high_similarities[-3:]]}")
-        print(f"{'='*50}")
+            lines.append(f"🎯 Son yüksek benzerlikler: {[f'%{s*100:.1f}' for s in high_similarities[-3:]]}")
+        lines.append('=' * 50)
+
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
         
     def load_original_data(self, file_path: str) -> List[Dict]:
         """Orijinal veri setini yükle"""
         try:
             self.log(f"📖 Orijinal veri yükleniyor: {file_path}")
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            data = _read_json_file(file_path)
+
             if not isinstance(data, list):
                 raise ValueError("Orijinal veri list formatında değil")
                 
@@ -173,9 +431,8 @@ class EnhancedOriginalVsRecoveredChecker:
         """Kurtarılan veriyi yükle"""
         try:
             self.log(f"📖 Kurtarılan veri yükleniyor: {file_path}")
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
+            data = _read_json_file(file_path)
+
             if not isinstance(data, list):
                 raise ValueError("Kurtarılan veri list formatında değil")
                 
@@ -187,31 +444,34 @@ class EnhancedOriginalVsRecoveredChecker:
             self.log(f"❌ Kurtarılan veri yüklenemedi: {e}", "ERROR")
             return []
             
-    def find_exact_duplicates(self, original_data: List[Dict], recovered_data: List[Dict]) -> Tuple[Set[str], List[Dict]]:
+    def get_qa_key(self, qa_pair: Dict) -> Tuple[str, str]:
+        """Q&A çifti için exact karşılaştırma anahtarı
+
+        Python'un str/tuple hash'i eşitlik kontrolü için yeterli;
+        MD5 hesaplamaya gerek yok.
+        """
+        return (qa_pair.get('soru', '').strip().lower(),
+                qa_pair.get('cevap', '').strip().lower())
+
+    def find_exact_duplicates(self, original_data: List[Dict], recovered_data: List[Dict]) -> Tuple[Set[Tuple[str, str]], List[Dict]]:
         """Exact duplicate'leri bul"""
         self.log_progress("EXACT DUPLICATE KONTROLÜ BAŞLATILIYOR")
         start_time = time.time()
-        
-        # Orijinal veri hash'leri
-        self.log("🔨 Orijinal veri hash'leri oluşturuluyor...")
-        original_hashes = set()
-        for i, qa in enumerate(original_data):
-            hash_val = self.get_qa_hash(qa)
-            original_hashes.add(hash_val)
-            
-            if (i + 1) % 5000 == 0:
-                progress = ((i + 1) / len(original_data)) * 100
-                self.log(f"   📈 Hash oluşturma: %{progress:.1f} ({i+1:,}/{len(original_data):,})")
-                
+
+        # Orijinal veri anahtarları (soru, cevap) tuple'ları - hash'lemeden set üyeliği
+        self.log("🔨 Orijinal veri anahtarları oluşturuluyor...")
+        original_keys = {self.get_qa_key(qa) for qa in original_data}
+        self.log(f"   📈 {len(original_keys):,} benzersiz anahtar hazır")
+
         # Kurtarılan veride exact duplicate'leri bul
         self.log("🔍 Kurtarılan veride duplicate kontrolü...")
         exact_duplicates = set()
         clean_recovered = []
-        
+
         for i, qa in enumerate(recovered_data):
-            hash_val = self.get_qa_hash(qa)
-            if hash_val in original_hashes:
-                exact_duplicates.add(hash_val)
+            key = self.get_qa_key(qa)
+            if key in original_keys:
+                exact_duplicates.add(key)
             else:
                 clean_recovered.append(qa)
                 
@@ -230,10 +490,88 @@ class EnhancedOriginalVsRecoveredChecker:
         
         return exact_duplicates, clean_recovered
         
+    def _tfidf_similar_duplicates(self, original_data: List[Dict], clean_recovered: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """TF-IDF char-n-gram + sparse cosine top-1 ile benzerlik taraması
+
+        N x M SequenceMatcher taraması yerine tek bir sparse matris
+        çarpımı: her recovered satırı için en benzer orijinal bulunur,
+        skor >= threshold ise similar sayılır.
+        """
+        start_time = time.time()
+        self.stats['processing_start_time'] = start_time
+
+        texts_orig = [f"{qa.get('soru', '')} {qa.get('cevap', '')}".strip().lower()
+                      for qa in original_data]
+        texts_rec = [f"{qa.get('soru', '')} {qa.get('cevap', '')}".strip().lower()
+                     for qa in clean_recovered]
+
+        self.log("🔨 TF-IDF vektörleri oluşturuluyor (char 3-5 gram)...")
+        vect = TfidfVectorizer(analyzer='char_wb', ngram_range=(3, 5))
+        vect.fit(texts_orig + texts_rec)
+        A = vect.transform(texts_rec)
+        B = vect.transform(texts_orig)
+
+        similar_pairs = []
+        ultra_clean_recovered = []
+
+        self.log(f"⚡ Sparse cosine top-1 hesaplanıyor ({A.shape[0]:,} x {B.shape[0]:,})...")
+        if awesome_cossim_topn is not None:
+            # Tek C++ kernel'de top-1 + threshold cutoff
+            matches = awesome_cossim_topn(A, B.T.tocsr(), ntop=1,
+                                          lower_bound=self.similarity_threshold)
+            for i, qa in enumerate(clean_recovered):
+                row = matches.indices[matches.indptr[i]:matches.indptr[i + 1]]
+                if row.size:
+                    score = float(matches.data[matches.indptr[i]])
+                    self.merge_similarity_stats(1, score, score, score)
+                    similar_pairs.append({
+                        'recovered': qa,
+                        'original': original_data[int(row[0])],
+                        'similarity': score
+                    })
+                else:
+                    ultra_clean_recovered.append(qa)
+        else:
+            # Fallback: chunk'lar halinde sparse çarpım + satır bazında max
+            BT = B.T.tocsc()
+            chunk = 1000
+            for lo in range(0, A.shape[0], chunk):
+                S = (A[lo:lo + chunk] @ BT).tocsr()
+                for r in range(S.shape[0]):
+                    row_data = S.data[S.indptr[r]:S.indptr[r + 1]]
+                    qa = clean_recovered[lo + r]
+                    if row_data.size:
+                        best = int(row_data.argmax())
+                        score = float(row_data[best])
+                        best_col = int(S.indices[S.indptr[r] + best])
+                        self.merge_similarity_stats(1, score, score, score)
+                        if score >= self.similarity_threshold:
+                            similar_pairs.append({
+                                'recovered': qa,
+                                'original': original_data[best_col],
+                                'similarity': score
+                            })
+                            continue
+                    ultra_clean_recovered.append(qa)
+
+        total_elapsed = time.time() - start_time
+        self.stats['similar_duplicates'] = len(similar_pairs)
+        self.stats['unique_augmented'] = len(ultra_clean_recovered)
+
+        self.log_progress(f"TF-IDF BENZERLİK ANALİZİ TAMAMLANDI ({total_elapsed:.1f}s)")
+        self.log(f"🔄 Benzer duplicate: {len(similar_pairs):,} adet")
+        self.log(f"✅ Benzersiz augmented: {len(ultra_clean_recovered):,} adet")
+
+        return similar_pairs, ultra_clean_recovered
+
     def find_similar_duplicates(self, original_data: List[Dict], clean_recovered: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
         """Benzer duplicate'leri bul (%85+ benzerlik) - ENHANCED"""
         self.log_progress(f"BENZERLİK ANALİZİ BAŞLATILIYOR (%{self.similarity_threshold*100:.0f}+ benzerlik)")
-        
+
+        # sklearn kuruluysa vektörize hızlı yol
+        if TfidfVectorizer is not None and original_data and clean_recovered:
+            return self._tfidf_similar_duplicates(original_data, clean_recovered)
+
         similar_pairs = []
         ultra_clean_recovered = []
         high_similarities = []  # Yüksek benzerlik skorlarını takip et
@@ -242,73 +580,88 @@ class EnhancedOriginalVsRecoveredChecker:
         start_time = time.time()
         self.stats['processing_start_time'] = start_time
         
+        use_parallel = self.worker_count > 1 and len(clean_recovered) >= self.parallel_min_items
+
         self.log(f"📊 Toplam karşılaştırma: {total_comparisons:,} işlem")
         self.log(f"🔍 Benzerlik threshold: %{self.similarity_threshold*100:.0f}")
         self.log(f"⚡ Progress raporu: Her {self.detailed_update_frequency} item")
-        
-        processed_comparisons = 0
-        
-        for i, recovered_qa in enumerate(clean_recovered):
-            is_similar = False
-            max_similarity = 0
-            best_match = None
-            item_start_time = time.time()
-            
-            for j, original_qa in enumerate(original_data):
-                similarity = self.calculate_similarity(recovered_qa, original_qa)
-                self.update_similarity_stats(similarity)
-                
-                if similarity > max_similarity:
-                    max_similarity = similarity
-                    best_match = original_qa
-                    
-                if similarity >= self.similarity_threshold:
-                    is_similar = True
-                    high_similarities.append(similarity)
-                    break
-                    
-                processed_comparisons += 1
-                
-                # Her 50 karşılaştırmada bir hız kontrolü
-                if j % 50 == 0 and j > 0:
-                    item_elapsed = time.time() - item_start_time
-                    if item_elapsed > 2:  # 2 saniyeden uzun sürüyorsa uyar
-                        comparisons_per_sec = j / item_elapsed
-                        self.log(f"   ⏳ Yavaş item #{i+1}: {comparisons_per_sec:.1f} karş./s")
-                        
-            # İşlem sonucu
-            if is_similar:
-                similar_pairs.append({
-                    'recovered': recovered_qa,
-                    'original': best_match,
-                    'similarity': max_similarity
-                })
-            else:
-                ultra_clean_recovered.append(recovered_qa)
-                
-            # Progress raporları
-            if (i + 1) % self.detailed_update_frequency == 0:
-                self.print_detailed_progress(
-                    i + 1, len(clean_recovered), start_time, 
-                    len(similar_pairs), high_similarities
-                )
-                
-            elif (i + 1) % self.progress_update_frequency == 0:
-                progress = ((i + 1) / len(clean_recovered)) * 100
-                elapsed = time.time() - start_time
-                eta = self.calculate_eta(i + 1, len(clean_recovered), start_time)
-                rate = (i + 1) / elapsed if elapsed > 0 else 0
-                
-                self.log_progress(f"İlerleme: %{progress:.1f} ({i+1:,}/{len(clean_recovered):,}) | "
-                                f"Hız: {rate:.1f} item/s | ETA: {eta} | "
-                                f"Similar: {len(similar_pairs):,}")
-                
-            # Bellek kontrolü (her 1000 item'da bir)
-            if (i + 1) % 1000 == 0:
-                memory_usage = self.get_memory_usage()
-                if float(memory_usage.replace('MB', '')) > 2048:  # 2GB üzeri uyarı
-                    self.log(f"⚠️ Yüksek bellek kullanımı: {memory_usage}", "WARNING")
-                    
+        if use_parallel:
+            self.log(f"🚀 Paralel mod: {self.worker_count} worker process")
+
+        # SoA ön işleme: hot loop hazır string listeleri üzerinde çalışır
+        orig_sorular, orig_cevaplar = _preprocess_qa_texts(original_data)
+        rec_texts = list(zip(*_preprocess_qa_texts(clean_recovered))) if clean_recovered else []
+
+        frozen = False
+        if use_parallel:
+            # Dış döngü item'lar arası bağımsız -> process havuzuna dağıt.
+            # fork varsa orijinal metinler child'lara pickle'lanmadan
+            # copy-on-write sayfalar olarak geçer; gc.freeze() GC'nin
+            # refcount/gc-bit yazmalarıyla bu sayfaları kopyalatmasını önler
+            mp_context = None
+            if 'fork' in multiprocessing.get_all_start_methods():
+                mp_context = multiprocessing.get_context('fork')
+                gc.collect()
+                gc.freeze()
+                frozen = True
+
+            executor = ProcessPoolExecutor(
+                max_workers=self.worker_count,
+                mp_context=mp_context,
+                initializer=_init_similarity_worker,
+                initargs=(orig_sorular, orig_cevaplar, self.similarity_threshold)
+            )
+            chunksize = max(1, len(clean_recovered) // (self.worker_count * 4))
+            results = executor.map(_similarity_worker, rec_texts, chunksize=chunksize)
+        else:
+            executor = None
+            _init_similarity_worker(orig_sorular, orig_cevaplar, self.similarity_threshold)
+            results = map(_similarity_worker, rec_texts)
+
+        try:
+            for i, (recovered_qa, result) in enumerate(zip(clean_recovered, results)):
+                is_similar, best_idx, max_similarity, comparisons, local_min, local_max, local_sum = result
+                self.merge_similarity_stats(comparisons, local_min, local_max, local_sum)
+
+                # İşlem sonucu
+                if is_similar:
+                    high_similarities.append(max_similarity)
+                    similar_pairs.append({
+                        'recovered': recovered_qa,
+                        'original': original_data[best_idx],
+                        'similarity': max_similarity
+                    })
+                else:
+                    ultra_clean_recovered.append(recovered_qa)
+
+                # Progress raporları (detaylı rapor sadece verbose >= 2'de)
+                if self.verbose >= 2 and (i + 1) % self.detailed_update_frequency == 0:
+                    self.print_detailed_progress(
+                        i + 1, len(clean_recovered), start_time,
+                        len(similar_pairs), high_similarities
+                    )
+
+                elif self.verbose >= 1 and (i + 1) % self.progress_update_frequency == 0:
+                    progress = ((i + 1) / len(clean_recovered)) * 100
+                    elapsed = time.time() - start_time
+                    eta = self.calculate_eta(i + 1, len(clean_recovered), start_time)
+                    rate = (i + 1) / elapsed if elapsed > 0 else 0
+
+                    self.log_progress(f"İlerleme: %{progress:.1f} ({i+1:,}/{len(clean_recovered):,}) | "
+                                    f"Hız: {rate:.1f} item/s | ETA: {eta} | "
+                                    f"Similar: {len(similar_pairs):,}")
+
+                # Bellek kontrolü (her 1000 item'da bir)
+                if (i + 1) % 1000 == 0:
+                    memory_mb = self.get_memory_usage()
+                    if memory_mb > 2048:  # 2GB üzeri uyarı
+                        self.log(f"⚠️ Yüksek bellek kullanımı: {memory_mb:.1f}MB", "WARNING")
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            if frozen:
+                gc.unfreeze()
+
         total_elapsed = time.time() - start_time
         avg_rate = len(clean_recovered) / total_elapsed if total_elapsed > 0 else 0
         
@@ -324,7 +677,7 @@ class EnhancedOriginalVsRecoveredChecker:
         
         return similar_pairs, ultra_clean_recovered
         
-    def create_detailed_report(self, exact_duplicates: Set[str], similar_pairs: List[Dict], 
+    def create_detailed_report(self, exact_duplicates: Set[Tuple[str, str]], similar_pairs: List[Dict],
                               original_data: List[Dict], recovered_data: List[Dict], 
                               ultra_clean_data: List[Dict]) -> Dict:
         """Gelişmiş detaylı rapor oluştur"""
@@ -356,8 +709,8 @@ class EnhancedOriginalVsRecoveredChecker:
         performance_metrics = {
             "total_processing_time_seconds": round(total_processing_time, 2),
             "average_items_per_second": round(len(recovered_data) / total_processing_time, 2) if total_processing_time > 0 else 0,
-            "memory_usage_mb": self.get_memory_usage(),
-            "similarity_calculations_performed": len(self.stats['similarities_found']),
+            "memory_usage_mb": round(self.get_memory_usage(), 1),
+            "similarity_calculations_performed": self.stats['similarity_count'],
             "max_similarity_found": round(self.stats['current_max_similarity'], 4),
             "min_similarity_found": round(self.stats['current_min_similarity'], 4),
             "avg_similarity_overall": round(self.stats['avg_similarity_so_far'], 4)
@@ -500,20 +853,17 @@ def main():
     
     # Final temiz veri seti
     final_file = f'output/enhanced_final_clean_dataset_{timestamp}.json'
-    with open(final_file, 'w', encoding='utf-8') as f:
-        json.dump(final_dataset, f, ensure_ascii=False, indent=2)
+    _write_json_file(final_dataset, final_file)
     print(f"💾 Final temiz veri seti: {final_file}")
-    
+
     # Sadece augmented veriler
     augmented_file = f'output/enhanced_clean_augmented_only_{timestamp}.json'
-    with open(augmented_file, 'w', encoding='utf-8') as f:
-        json.dump(clean_augmented, f, ensure_ascii=False, indent=2)
+    _write_json_file(clean_augmented, augmented_file)
     print(f"💾 Temiz augmented veriler: {augmented_file}")
-    
+
     # Enhanced analiz raporu
     report_file = f'output/enhanced_duplicate_analysis_report_{timestamp}.json'
-    with open(report_file, 'w', encoding='utf-8') as f:
-        json.dump(report, f, ensure_ascii=False, indent=2)
+    _write_json_file(report, report_file)
     print(f"📋 Enhanced duplicate analiz raporu: {report_file}")
     
     # Detaylı özet rapor
@@ -5,14 +5,55 @@ Ultra Safe Safety Monitor
 Güvenlik izleme, maliyet takibi ve performans monitörü
 """
 
+import bisect
 import time
 import json
 import logging
+import random
 import psutil
+from array import array
+from collections import deque
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import asyncio
 
+class _PsutilCache:
+    """psutil okumaları için kısa TTL cache
+
+    Monitor'ler sıkı döngüde virtual_memory/cpu_percent/disk_usage
+    çağırıyor; her biri ayrı /proc okuması. TTL içinde son değer döner.
+    """
+
+    def __init__(self, ttl: float = 2.0):
+        self.ttl = ttl
+        self._cache = {}
+
+    def get(self, key, fn):
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and now - hit[0] < self.ttl:
+            return hit[1]
+        value = fn()
+        self._cache[key] = (now, value)
+        return value
+
+
+# Modül genelinde tek cache: tüm monitor'ler aynı snapshot'ı paylaşır
+_psutil_cache = _PsutilCache()
+
+
+def _virtual_memory():
+    return _psutil_cache.get('virtual_memory', psutil.virtual_memory)
+
+
+def _cpu_percent():
+    return _psutil_cache.get('cpu_percent', psutil.cpu_percent)
+
+
+def _disk_usage_root():
+    return _psutil_cache.get('disk_usage', lambda: psutil.disk_usage('/'))
+
+
 class SafetyMonitor:
     """Güvenlik izleme sistemi"""
     
@@ -24,26 +65,24 @@ class SafetyMonitor:
         self.max_fails_per_hour = config['safety_settings']['max_fails_per_hour']
         self.emergency_threshold = config['safety_settings']['emergency_shutdown_threshold']
         
-        # İzleme verileri
-        self.failure_times: List[str] = []
+        # İzleme verileri - monotonic float timestamp'ler, bounded deque
+        self.failure_times: deque = deque()
         self.performance_data: List[Dict] = []
         self.alerts_sent = 0
-        
+        self._midnight: Optional[datetime] = None  # Günlük uptime hesabı için cache
+
     def record_failure(self, error_type: str, details: str):
         """Başarısızlık kaydet"""
-        failure_record = {
-            'timestamp': datetime.now().isoformat(),
-            'error_type': error_type,
-            'details': details
-        }
-        
-        self.failure_times.append(failure_record['timestamp'])
-        self.logger.error(f"Başarısızlık kaydedildi: {error_type} - {details}")
-        
-        # Eski kayıtları temizle (son 1 saat)
-        cutoff_time = datetime.now() - timedelta(hours=1)
-        cutoff_time_str = cutoff_time.isoformat()
-        self.failure_times = [t for t in self.failure_times if t > cutoff_time_str]
+        now = time.monotonic()
+        self.failure_times.append(now)
+        # %-style: format maliyeti logging'e bırakılır (handler emit etmezse hiç çalışmaz)
+        self.logger.error("Başarısızlık kaydedildi: %s - %s", error_type, details)
+
+        # Eski kayıtları temizle (son 1 saat) - O(1) amortize popleft,
+        # liste yeniden kurma ve string karşılaştırma yok
+        cutoff = now - 3600
+        while self.failure_times and self.failure_times[0] < cutoff:
+            self.failure_times.popleft()
         
     def should_emergency_stop(self, current_stats: Dict) -> bool:
         """Acil durdurma gerekli mi?"""
@@ -60,8 +99,8 @@ class SafetyMonitor:
                 self.logger.critical(f"Toplam basarisizlik limiti asildi: {total_failures}")
                 return True
                 
-            # Memory kontrolü
-            memory_percent = psutil.virtual_memory().percent
+            # Memory kontrolü (TTL cache'li okuma)
+            memory_percent = _virtual_memory().percent
             if memory_percent > 90:
                 self.logger.critical(f"Memory kullanimi kritik: %{memory_percent}")
                 return True
@@ -75,23 +114,37 @@ class SafetyMonitor:
             self.logger.error(f"Emergency check hatası: {e}")
             return False
             
+    def _today_midnight(self, now: datetime) -> datetime:
+        """Gün başlangıcı - gün değişmedikçe cache'den döner"""
+        if self._midnight is None or self._midnight.date() != now.date():
+            self._midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return self._midnight
+
     def generate_safety_report(self) -> Dict:
         """Güvenlik raporu oluştur"""
+        # Sistem okumaları tek seferde local'lere alınır (TTL cache'li);
+        # datetime.now() rapor başına bir kez çağrılır
+        now = datetime.now()
+        memory = _virtual_memory()
+        disk = _disk_usage_root()
+
         return {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now.isoformat(),
             'recent_failures_count': len(self.failure_times),
             'alerts_sent': self.alerts_sent,
-            'memory_usage': psutil.virtual_memory().percent,
-            'cpu_usage': psutil.cpu_percent(),
-            'disk_usage': psutil.disk_usage('/').percent,
-            'uptime': str(datetime.now() - datetime.now().replace(hour=0, minute=0, second=0))
+            'memory_usage': memory.percent,
+            'cpu_usage': _cpu_percent(),
+            'disk_usage': disk.percent,
+            'uptime': str(now - self._today_midnight(now))
         }
 
 class CostTracker:
     """Maliyet takip sistemi"""
-    
-    def __init__(self):
+
+    def __init__(self, rate_limiter: Optional['RateLimiter'] = None):
         self.logger = logging.getLogger(__name__)
+        # RateLimiter verilirse gerçek token kullanımı RPM/TPM penceresine işlenir
+        self.rate_limiter = rate_limiter
         
         # Gemini API fiyatları (varsayılan - güncellenmeli)
         self.pricing = {
@@ -99,53 +152,61 @@ class CostTracker:
             'output_tokens_per_1k': 0.0005,  # $0.0005 per 1K tokens
             'free_tier_limit': 50000  # Aylık ücretsiz token limiti
         }
-        
-        # Kullanım verileri
+
+        # Token başına fiyat bir kez hesaplanır (hot path'te bölme yok)
+        self._in_per_tok = self.pricing['input_tokens_per_1k'] / 1000
+        self._out_per_tok = self.pricing['output_tokens_per_1k'] / 1000
+        self._free_tier_warned = False
+
+        # Kullanım verileri - sadece tamsayı sayaçlar; maliyet istek
+        # başına değil, rapor istendiğinde hesaplanır
         self.usage_data = {
             'total_input_tokens': 0,
             'total_output_tokens': 0,
             'total_requests': 0,
-            'estimated_cost': 0.0,
-            'start_time': datetime.now().isoformat()
+            'start_time': time.time()  # float epoch; ISO çevrimi sadece raporda
         }
-        
+
     def track_request(self, batch_size: int, estimated_input_tokens: int = 2000, estimated_output_tokens: int = 3000):
         """İstek kullanımını takip et"""
         try:
             self.usage_data['total_requests'] += 1
             self.usage_data['total_input_tokens'] += estimated_input_tokens
             self.usage_data['total_output_tokens'] += estimated_output_tokens
-            
-            # Maliyet hesapla
-            input_cost = (self.usage_data['total_input_tokens'] / 1000) * self.pricing['input_tokens_per_1k']
-            output_cost = (self.usage_data['total_output_tokens'] / 1000) * self.pricing['output_tokens_per_1k']
-            
-            self.usage_data['estimated_cost'] = input_cost + output_cost
-            
-            # Ücretsiz limit kontrolü
-            total_tokens = self.usage_data['total_input_tokens'] + self.usage_data['total_output_tokens']
-            if total_tokens > self.pricing['free_tier_limit']:
-                self.logger.warning(f"⚠️ Ücretsiz limit aşıldı: {total_tokens:,} tokens")
-                
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.record_token_usage(estimated_input_tokens + estimated_output_tokens)
+
+            # Ücretsiz limit kontrolü - bir kez uyar, her istekte spam'leme
+            if not self._free_tier_warned:
+                total_tokens = self.usage_data['total_input_tokens'] + self.usage_data['total_output_tokens']
+                if total_tokens > self.pricing['free_tier_limit']:
+                    self._free_tier_warned = True
+                    self.logger.warning(f"⚠️ Ücretsiz limit aşıldı: {total_tokens:,} tokens")
+
         except Exception as e:
             self.logger.error(f"Cost tracking hatası: {e}")
-            
+
+    def _estimated_cost(self) -> float:
+        """Toplam sayaçlardan tahmini maliyet (lazy)"""
+        return (self.usage_data['total_input_tokens'] * self._in_per_tok +
+                self.usage_data['total_output_tokens'] * self._out_per_tok)
+
     def get_estimated_cost(self) -> str:
         """Tahmini maliyeti getir"""
-        return f"${self.usage_data['estimated_cost']:.4f}"
+        return f"${self._estimated_cost():.4f}"
         
     def get_full_report(self) -> Dict:
         """Tam maliyet raporu"""
-        start_time = datetime.fromisoformat(self.usage_data['start_time'])
-        elapsed_time = datetime.now() - start_time
-        
+        elapsed_seconds = time.time() - self.usage_data['start_time']
+
         return {
             'total_requests': self.usage_data['total_requests'],
             'total_input_tokens': self.usage_data['total_input_tokens'],
             'total_output_tokens': self.usage_data['total_output_tokens'],
-            'estimated_cost_usd': self.usage_data['estimated_cost'],
-            'tokens_per_minute': (self.usage_data['total_input_tokens'] + self.usage_data['total_output_tokens']) / max(elapsed_time.total_seconds() / 60, 1),
-            'elapsed_time': str(elapsed_time),
+            'estimated_cost_usd': self._estimated_cost(),
+            'tokens_per_minute': (self.usage_data['total_input_tokens'] + self.usage_data['total_output_tokens']) / max(elapsed_seconds / 60, 1),
+            'elapsed_time': str(timedelta(seconds=int(elapsed_seconds))),
             'free_tier_remaining': max(0, self.pricing['free_tier_limit'] - (self.usage_data['total_input_tokens'] + self.usage_data['total_output_tokens']))
         }
 
@@ -166,26 +227,115 @@ class RateLimiter:
         self.success_streak = 0
         self.failure_streak = 0
         self.last_request_time = 0
-        
+
         # Adaptif ayarlar
         self.adaptive_mode = True
+
+        # AIMD eşzamanlılık kontrolü (TCP congestion control deseni):
+        # ölçülen gecikme hedefin altındaysa additive increase,
+        # aşım/başarısızlıkta multiplicative decrease
+        safety = config['safety_settings']
+        self.min_concurrency = 1
+        self.max_concurrency = safety.get('max_concurrency', 8)
+        self.target_latency = safety.get('target_latency_seconds', 5.0)
+        self.concurrency = self.min_concurrency
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self._permit_deficit = 0  # Düşüşte geri yutulacak slot sayısı
+        self.latencies = deque(maxlen=20)
+        self.inflight = 0  # Pool'da key seçimi için anlık yük
+
+        # Sliding-window RPM/TPM token bucket: limit dolmadan bloklar,
+        # böylece 429 hiç yenmez (reaktif back-off yerine proaktif throttle)
+        self.rpm_limit = safety.get('rpm_limit', 60)
+        self.tpm_limit = safety.get('tpm_limit', 1_000_000)
+        self.request_window = deque()  # (monotonic_ts, tokens)
+        self.window_tokens = 0
+
+    async def acquire(self):
+        """İstek slotu al (AIMD eşzamanlılık limiti)"""
+        await self.semaphore.acquire()
+        self.inflight += 1
+
+    def release(self):
+        """İstek slotunu bırak"""
+        self.inflight = max(0, self.inflight - 1)
+        if self._permit_deficit > 0:
+            # Multiplicative decrease sonrası fazla slotları yut
+            self._permit_deficit -= 1
+        else:
+            self.semaphore.release()
+
+    def record_latency(self, latency: float):
+        """Gözlenen istek gecikmesini kaydet ve AIMD limitini güncelle"""
+        self.latencies.append(latency)
+        if len(self.latencies) < self.latencies.maxlen:
+            return
+
+        avg_latency = sum(self.latencies) / len(self.latencies)
+        self.latencies.clear()
+
+        if avg_latency <= self.target_latency:
+            # Additive increase: sağlıklıyken limiti 1 artır
+            if self.concurrency < self.max_concurrency:
+                self.concurrency += 1
+                self.semaphore.release()
+                self.logger.debug("AIMD: eşzamanlılık artırıldı -> %d", self.concurrency)
+        else:
+            self._decrease_concurrency()
+
+    def _decrease_concurrency(self):
+        """Multiplicative decrease: limiti yarıya indir"""
+        new_concurrency = max(self.min_concurrency, self.concurrency // 2)
+        if new_concurrency < self.concurrency:
+            self._permit_deficit += self.concurrency - new_concurrency
+            self.concurrency = new_concurrency
+            self.logger.warning("AIMD: eşzamanlılık düşürüldü -> %d", self.concurrency)
         
-    async def wait_if_needed(self):
-        """Gerekirse bekle"""
+    async def wait_if_needed(self, estimated_tokens: int = 0):
+        """Gerekirse bekle (minimum aralık + RPM/TPM penceresi)"""
         try:
             current_time = time.time()
             time_since_last = current_time - self.last_request_time
-            
+
             if time_since_last < self.current_delay:
                 wait_time = self.current_delay - time_since_last
-                self.logger.debug(f"Rate limit beklemesi: {wait_time:.1f}s")
+                # DEBUG kapalıyken (production) f-string bile kurulmasın
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Rate limit beklemesi: %.1fs", wait_time)
                 await asyncio.sleep(wait_time)
-                
+
+            # 60s'lik pencerede yer açılana kadar blokla
+            window = self.request_window
+            while True:
+                now = time.monotonic()
+                while window and window[0][0] < now - 60:
+                    self.window_tokens -= window.popleft()[1]
+
+                if not window:
+                    break
+                if (len(window) < self.rpm_limit and
+                        self.window_tokens + estimated_tokens <= self.tpm_limit):
+                    break
+
+                wait_time = window[0][0] + 60 - now
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("RPM/TPM penceresi dolu, bekleme: %.1fs", wait_time)
+                await asyncio.sleep(max(wait_time, 0.05))
+
+            window.append((time.monotonic(), estimated_tokens))
+            self.window_tokens += estimated_tokens
             self.last_request_time = time.time()
-            
+
         except Exception as e:
             self.logger.error(f"Rate limiter hatası: {e}")
             await asyncio.sleep(self.base_delay)
+
+    def record_token_usage(self, tokens: int):
+        """Son isteğin gerçek token kullanımını pencereye işle"""
+        if self.request_window:
+            ts, estimated = self.request_window[-1]
+            self.request_window[-1] = (ts, tokens)
+            self.window_tokens += tokens - estimated
             
     def record_success(self):
         """Başarı kaydet"""
@@ -196,7 +346,8 @@ class RateLimiter:
             # Başarı streak'i varsa hızlan
             self.current_delay = max(self.min_delay, self.current_delay * 0.9)
             self.success_streak = 0
-            self.logger.debug(f"Rate limit azaltıldı: {self.current_delay:.1f}s")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Rate limit azaltıldı: %.1fs", self.current_delay)
             
     def record_failure(self):
         """Başarısızlık kaydet"""
@@ -204,9 +355,14 @@ class RateLimiter:
         self.success_streak = 0
         
         if self.adaptive_mode:
-            # Başarısızlık varsa yavaşla
-            self.current_delay = min(self.max_delay, self.current_delay * 1.5)
-            self.logger.warning(f"Rate limit artırıldı: {self.current_delay:.1f}s")
+            # Başarısızlık varsa yavaşla - jitter'lı exponential back-off:
+            # aynı anda fail eden istemcilerin senkron retry etmesini önler
+            self.current_delay = min(self.max_delay,
+                                     self.current_delay * random.uniform(1.5, 2.0))
+            self.logger.warning("Rate limit artırıldı: %.1fs", self.current_delay)
+
+        # 429/timeout AIMD için de sinyal: limiti hemen düşür
+        self._decrease_concurrency()
             
     def get_current_delay(self) -> float:
         """Mevcut delay değeri"""
@@ -218,82 +374,117 @@ class RateLimiter:
         self.success_streak = 0
         self.failure_streak = 0
 
+class RateLimiterPool:
+    """API key başına ayrı RateLimiter bucket'ı
+
+    Tek global delay yerine her key kendi AIMD durumunu, semaforunu ve
+    RPM/TPM penceresini taşır: yavaşlayan/back-off'taki bir key
+    diğerlerini frenlemez, toplam verim sağlıklı key sayısıyla ölçeklenir.
+    """
+
+    def __init__(self, config: Dict, api_keys: List[str]):
+        self.logger = logging.getLogger(__name__)
+        self.buckets: Dict[str, RateLimiter] = {
+            key: RateLimiter(config) for key in api_keys
+        }
+
+    def pick_key(self) -> str:
+        """En az yüklü (düşük delay + az inflight) key'i seç"""
+        return min(self.buckets,
+                   key=lambda k: (self.buckets[k].current_delay,
+                                  self.buckets[k].inflight))
+
+    async def acquire(self, key: str):
+        await self.buckets[key].acquire()
+
+    def release(self, key: str):
+        self.buckets[key].release()
+
+    async def wait_if_needed(self, key: str, estimated_tokens: int = 0):
+        await self.buckets[key].wait_if_needed(estimated_tokens)
+
+    def record_success(self, key: str):
+        self.buckets[key].record_success()
+
+    def record_failure(self, key: str):
+        self.buckets[key].record_failure()
+
+    def record_latency(self, key: str, latency: float):
+        self.buckets[key].record_latency(latency)
+
+    def record_token_usage(self, key: str, tokens: int):
+        self.buckets[key].record_token_usage(tokens)
+
+class _RingBuffer:
+    """Sabit boyutlu float ring buffer
+
+    Dict listesi + [-N:] dilimleme yerine: array('d') içine yazma O(1),
+    trim bedava (eski değerin üstüne yazılır), ortalama C-level sum() ile.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.buf = array('d', bytes(8 * size))
+        self.idx = 0
+        self.count = 0
+
+    def append(self, value: float):
+        self.buf[self.idx] = value
+        self.idx = (self.idx + 1) % self.size
+        if self.count < self.size:
+            self.count += 1
+
+    def mean(self) -> float:
+        if self.count == 0:
+            return 0.0
+        if self.count < self.size:
+            return sum(self.buf[:self.count]) / self.count
+        return sum(self.buf) / self.size
+
+    def __len__(self) -> int:
+        return self.count
+
+
 class PerformanceMonitor:
     """Performans izleme sistemi"""
-    
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.metrics = {
-            'batch_processing_times': [],
-            'api_response_times': [],
-            'validation_times': [],
-            'memory_snapshots': [],
-            'cpu_snapshots': []
-        }
-        
+        # Son N değer sabit boyutlu ring buffer'larda tutulur
+        self.batch_times = _RingBuffer(100)
+        self.api_times = _RingBuffer(100)
+        self.memory_snapshots = _RingBuffer(50)
+        self.cpu_snapshots = _RingBuffer(50)
+
     def record_batch_time(self, processing_time: float):
         """Batch işlem süresini kaydet"""
-        self.metrics['batch_processing_times'].append({
-            'timestamp': datetime.now().isoformat(),
-            'duration': processing_time
-        })
-        
-        # Son 100 kayıt tut
-        if len(self.metrics['batch_processing_times']) > 100:
-            self.metrics['batch_processing_times'] = self.metrics['batch_processing_times'][-100:]
-            
+        self.batch_times.append(processing_time)
+
     def record_api_time(self, response_time: float):
         """API yanıt süresini kaydet"""
-        self.metrics['api_response_times'].append({
-            'timestamp': datetime.now().isoformat(),
-            'duration': response_time
-        })
-        
-        if len(self.metrics['api_response_times']) > 100:
-            self.metrics['api_response_times'] = self.metrics['api_response_times'][-100:]
-            
+        self.api_times.append(response_time)
+
     def take_system_snapshot(self):
         """Sistem anlık görüntüsü"""
         try:
-            snapshot = {
-                'timestamp': datetime.now().isoformat(),
-                'memory_percent': psutil.virtual_memory().percent,
-                'cpu_percent': psutil.cpu_percent(),
-                'available_memory_gb': psutil.virtual_memory().available / (1024**3)
-            }
-            
-            self.metrics['memory_snapshots'].append(snapshot)
-            
-            # Son 50 snapshot tut
-            if len(self.metrics['memory_snapshots']) > 50:
-                self.metrics['memory_snapshots'] = self.metrics['memory_snapshots'][-50:]
-                
+            memory = _virtual_memory()
+            self.memory_snapshots.append(memory.percent)
+            self.cpu_snapshots.append(_cpu_percent())
+
         except Exception as e:
             self.logger.error(f"System snapshot hatası: {e}")
-            
+
     def get_performance_summary(self) -> Dict:
         """Performans özeti"""
         try:
-            # Batch processing ortalaması
-            batch_times = [m['duration'] for m in self.metrics['batch_processing_times']]
-            avg_batch_time = sum(batch_times) / len(batch_times) if batch_times else 0
-            
-            # API response ortalaması
-            api_times = [m['duration'] for m in self.metrics['api_response_times']]
-            avg_api_time = sum(api_times) / len(api_times) if api_times else 0
-            
-            # Memory ortalaması
-            memory_values = [m['memory_percent'] for m in self.metrics['memory_snapshots']]
-            avg_memory = sum(memory_values) / len(memory_values) if memory_values else 0
-            
             return {
-                'average_batch_time': avg_batch_time,
-                'average_api_time': avg_api_time,
-                'average_memory_usage': avg_memory,
-                'total_batches_monitored': len(batch_times),
-                'total_api_calls_monitored': len(api_times)
+                'average_batch_time': self.batch_times.mean(),
+                'average_api_time': self.api_times.mean(),
+                'average_memory_usage': self.memory_snapshots.mean(),
+                'total_batches_monitored': len(self.batch_times),
+                'total_api_calls_monitored': len(self.api_times)
             }
-            
+
         except Exception as e:
             self.logger.error(f"Performance summary hatası: {e}")
             return {}
@@ -303,18 +494,20 @@ class AlertSystem:
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.alert_history = []
-        
+        # (monotonic_ts, alert) çiftleri - append sırasıyla doğal sıralı,
+        # zaman kesiti bisect ile O(log N) bulunur
+        self.alert_history: List[tuple] = []
+
     def send_alert(self, level: str, message: str, details: Dict = None):
         """Uyarı gönder"""
         alert = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.time(),  # float epoch; ISO çevrimi okuma anında
             'level': level,
             'message': message,
             'details': details or {}
         }
-        
-        self.alert_history.append(alert)
+
+        self.alert_history.append((time.monotonic(), alert))
         
         # Log level'a göre kaydet
         if level == 'critical':
@@ -324,12 +517,20 @@ class AlertSystem:
         elif level == 'info':
             self.logger.info(f"ℹ️ INFO: {message}")
             
-        # Alert history'yi sınırla
+        # Alert history'yi sınırla - del ile in-place trim: yeni liste
+        # kopyalamak yerine baştaki elemanlar tek hamlede düşer
         if len(self.alert_history) > 1000:
-            self.alert_history = self.alert_history[-500:]
+            del self.alert_history[:-500]
             
     def get_recent_alerts(self, hours: int = 1) -> List[Dict]:
         """Son uyarıları getir"""
-        cutoff_time = datetime.now() - timedelta(hours=hours)
-        cutoff_time_str = cutoff_time.isoformat()
-        return [alert for alert in self.alert_history if alert['timestamp'] > cutoff_time_str] 
\ No newline at end of file
+        cutoff = time.monotonic() - hours * 3600
+        idx = bisect.bisect_left(self.alert_history, (cutoff,))
+
+        # Dış tüketiciler için timestamp burada ISO string'e çevrilir
+        recent = []
+        for _, alert in self.alert_history[idx:]:
+            out = dict(alert)
+            out['timestamp'] = datetime.fromtimestamp(alert['timestamp']).isoformat()
+            recent.append(out)
+        return recent 
\ No newline at end of file
@@ -6,20 +6,73 @@ BASIT VE HIZLI VERİ BİRLEŞTİRME VE KARŞILAŞTIRMA
 """
 
 import json
-import glob
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from difflib import SequenceMatcher
 
+try:
+    import orjson  # Rust tabanlı parser, stdlib json'dan 2-3x hızlı
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard as zstd  # SIMD decompress ~GB/s, 5-10x küçük dosya
+except ImportError:
+    zstd = None
+
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:
+    MinHash = None  # Fallback: N x M tarama
+    MinHashLSH = None
+
+try:
+    from rapidfuzz.fuzz import ratio as _rf_ratio  # C++/SIMD, SequenceMatcher'dan 20-50x hızlı
+except ImportError:
+    _rf_ratio = None
+
+try:
+    import xxhash
+
+    def text_hash(text):
+        """64-bit içerik hash'i (SIMD hızlandırmalı xxh3)"""
+        return xxhash.xxh3_64_intdigest(text.encode('utf-8'))
+except ImportError:
+    def text_hash(text):
+        """64-bit içerik hash'i (stdlib fallback: str hash)"""
+        return hash(text)
+
+MINHASH_PERMS = 128
+SHINGLE_SIZE = 5
+
+def build_minhash(text):
+    """Metin için 5-gram shingle MinHash imzası"""
+    mh = MinHash(num_perm=MINHASH_PERMS)
+    for i in range(max(1, len(text) - SHINGLE_SIZE + 1)):
+        mh.update(text[i:i + SHINGLE_SIZE].encode('utf-8'))
+    return mh
+
 def load_json(file_path):
-    """JSON dosyası yükle"""
+    """JSON dosyası yükle (.zst uzantısı varsa zstd ile aç)"""
     try:
+        if file_path.endswith('.zst') and zstd is not None:
+            with open(file_path, 'rb') as raw:
+                data = zstd.ZstdDecompressor().stream_reader(raw).read()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
         with open(file_path, 'r', encoding='utf-8') as f:
             return json.load(f)
     except:
         return []
 
 def text_similarity(a, b):
-    """İki metin arasındaki benzerlik %"""
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+    """İki metin arasındaki benzerlik % (girdiler önceden casefold edilmiş olmalı)"""
+    if _rf_ratio is not None:
+        return _rf_ratio(a, b) / 100.0
+    return SequenceMatcher(None, a, b).ratio()
 
 def quick_merge_and_check():
     """Hızlı birleştirme ve kontrol"""
@@ -30,36 +83,43 @@ def quick_merge_and_check():
     original_data = load_json('250630AllData.json')
     print(f"✅ Orijinal: {len(original_data):,} Q&A")
     
-    # 2. Backup dosyalarını bul (650'ye kadar)
+    # 2. Backup dosyalarını bul (650'ye kadar) - 14 ayrı glob yerine
+    # dizin bir kez taranır, batch no dosya adından parse edilir
+    batch_pattern = re.compile(r'backup_batch_(\d+)_.*\.json$')
     backup_files = []
-    for i in range(0, 651, 50):  # 0, 50, 100, 150, ... 650
-        pattern = f'backups/backup_batch_{i}_*.json'
-        files = glob.glob(pattern)
-        if files:
-            backup_files.extend(files)
-    
+    try:
+        with os.scandir('backups') as it:
+            for entry in it:
+                m = batch_pattern.match(entry.name)
+                if m and 0 <= int(m.group(1)) <= 650 and int(m.group(1)) % 50 == 0:
+                    backup_files.append(entry.path)
+    except FileNotFoundError:
+        pass
+
     backup_files.sort()
     print(f"📁 {len(backup_files)} backup dosyası bulundu")
     
-    # 3. Backup'ları birleştir
+    # 3. Backup'ları birleştir (dosyalar tüm core'larda paralel parse edilir)
     print("🔄 Backup'lar birleştiriliyor...")
     all_backup_data = []
-    for file_path in backup_files:
-        data = load_json(file_path)
-        all_backup_data.extend(data)
-        print(f"   📄 {file_path}: {len(data):,} veri")
+    with ProcessPoolExecutor() as executor:
+        for file_path, data in zip(backup_files,
+                                   executor.map(load_json, backup_files, chunksize=2)):
+            all_backup_data.extend(data)
+            print(f"   📄 {file_path}: {len(data):,} veri")
     
     print(f"✅ Toplam backup: {len(all_backup_data):,} Q&A")
     
     # 4. Basit duplicate temizleme (backup içinde)
+    # Tam string yerine 8 byte'lık hash saklanır: bellek ve insert maliyeti düşer
     print("🧹 Backup içi duplicate temizleme...")
-    seen_texts = set()
+    seen_hashes = set()
     clean_backup = []
-    
+
     for qa in all_backup_data:
-        qa_text = qa.get('soru', '') + qa.get('cevap', '')
-        if qa_text not in seen_texts:
-            seen_texts.add(qa_text)
+        h = text_hash(qa.get('soru', '') + qa.get('cevap', ''))
+        if h not in seen_hashes:
+            seen_hashes.add(h)
             clean_backup.append(qa)
     
     print(f"✅ Temiz backup: {len(clean_backup):,} Q&A")
@@ -69,24 +129,72 @@ def quick_merge_and_check():
     print("🔍 Orijinal ile benzerlik kontrolü...")
     similar_count = 0
     unique_backup = []
-    
-    for i, backup_qa in enumerate(clean_backup):
-        if i % 1000 == 0:
-            print(f"   📊 İlerleme: {i:,}/{len(clean_backup):,}")
-        
-        is_similar = False
-        backup_text = backup_qa.get('soru', '') + ' ' + backup_qa.get('cevap', '')
-        
-        for orig_qa in original_data:
-            orig_text = orig_qa.get('soru', '') + ' ' + orig_qa.get('cevap', '')
-            
-            if text_similarity(backup_text, orig_text) > 0.85:
+
+    # Orijinal metinler bir kez kurulur; birebir eşleşenler set lookup ile
+    # O(1)'de yakalanır, benzerlik hesabına hiç girmez
+    orig_texts = [orig_qa.get('soru', '') + ' ' + orig_qa.get('cevap', '')
+                  for orig_qa in original_data]
+    orig_hash_set = {text_hash(t) for t in orig_texts}
+
+    # casefold() kayıt başına BİR kez: iç döngüdeki 2·N·M .lower() çağrısı
+    # ve geçici string tahsisleri kalkar (Türkçe İ/ı için de doğru katlama)
+    orig_texts_lc = [t.casefold() for t in orig_texts]
+
+    if MinHashLSH is not None:
+        # LSH index bir kez kurulur; her backup item için N yerine sadece
+        # aday orijinaller karşılaştırılır -> O(N*M) yerine ~O(N+M)
+        print("⚡ MinHash LSH index kuruluyor...")
+        lsh = MinHashLSH(threshold=0.85, num_perm=MINHASH_PERMS)
+        for idx, orig_text_lc in enumerate(orig_texts_lc):
+            lsh.insert(str(idx), build_minhash(orig_text_lc))
+
+        for i, backup_qa in enumerate(clean_backup):
+            if i % 1000 == 0:
+                print(f"   📊 İlerleme: {i:,}/{len(clean_backup):,}")
+
+            backup_text = backup_qa.get('soru', '') + ' ' + backup_qa.get('cevap', '')
+
+            # Birebir aynıysa benzerlik hesabına gerek yok
+            if text_hash(backup_text) in orig_hash_set:
                 similar_count += 1
-                is_similar = True
-                break
-        
-        if not is_similar:
-            unique_backup.append(backup_qa)
+                continue
+
+            backup_lc = backup_text.casefold()
+            is_similar = False
+
+            # LSH adayları + SequenceMatcher ile son doğrulama
+            for candidate in lsh.query(build_minhash(backup_lc)):
+                if text_similarity(backup_lc, orig_texts_lc[int(candidate)]) > 0.85:
+                    similar_count += 1
+                    is_similar = True
+                    break
+
+            if not is_similar:
+                unique_backup.append(backup_qa)
+    else:
+        # datasketch yoksa eski N x M tarama
+        for i, backup_qa in enumerate(clean_backup):
+            if i % 1000 == 0:
+                print(f"   📊 İlerleme: {i:,}/{len(clean_backup):,}")
+
+            backup_text = backup_qa.get('soru', '') + ' ' + backup_qa.get('cevap', '')
+
+            # Birebir aynıysa benzerlik hesabına gerek yok
+            if text_hash(backup_text) in orig_hash_set:
+                similar_count += 1
+                continue
+
+            backup_lc = backup_text.casefold()
+            is_similar = False
+
+            for orig_text_lc in orig_texts_lc:
+                if text_similarity(backup_lc, orig_text_lc) > 0.85:
+                    similar_count += 1
+                    is_similar = True
+                    break
+
+            if not is_similar:
+                unique_backup.append(backup_qa)
     
     # 6. Sonuçlar
     print("\n🎯 === SONUÇLAR ===")
@@ -99,10 +207,22 @@ def quick_merge_and_check():
     # 7. Final birleştirme
     final_dataset = original_data + unique_backup
     
-    # 8. Kaydet
+    # 8. Kaydet - kompakt JSON (indent = yüzlerce MB beyaz boşluk);
+    # zstandard varsa level 3 ile sıkıştır: 5-10x küçük dosya
     output_file = f'final_merged_dataset_{len(final_dataset)}.json'
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(final_dataset, f, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        payload = orjson.dumps(final_dataset)
+    else:
+        payload = json.dumps(final_dataset, ensure_ascii=False).encode('utf-8')
+
+    if zstd is not None:
+        output_file += '.zst'
+        cctx = zstd.ZstdCompressor(level=3)
+        with open(output_file, 'wb') as raw, cctx.stream_writer(raw) as w:
+            w.write(payload)
+    else:
+        with open(output_file, 'wb') as f:
+            f.write(payload)
     
     print(f"💾 Kaydedildi: {output_file}")
     print("✅ TAMAMLANDI!")
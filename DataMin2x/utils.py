@@ -9,18 +9,116 @@ import json
 import re
 import gc
 import os
+import time
 import logging
+import threading
 import psutil
+from collections import Counter
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 import hashlib
 
+try:
+    import orjson  # Rust tabanlı parser: her LLM yanıtında stdlib json'dan kat kat hızlı
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson  # SIMD stage-1 parse; tape buffer çağrılar arası yeniden kullanılır
+except ImportError:
+    simdjson = None
+
+try:
+    from blake3 import blake3 as _blake3  # AVX2/AVX-512/NEON hash çekirdekleri
+except ImportError:
+    _blake3 = None
+
+try:
+    import numpy as np  # Toplu token tahmini için vektörize yol
+except ImportError:
+    np = None
+
+
+def fingerprint(data) -> str:
+    """İçerik parmak izi (dedup için, SIMD hızlandırmalı)
+
+    blake3 varsa onu, yoksa hashlib.blake2b'yi (16 byte digest)
+    kullanır; ikisi de md5/sha256'dan belirgin hızlıdır.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if _blake3 is not None:
+        return _blake3(data).hexdigest()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+try:
+    # regex modülü POSIX (leftmost-longest) modda backtracking'siz eşleşir;
+    # kötü biçimli uzun LLM çıktısında worst-case lineer kalır
+    import regex as _regex
+except ImportError:
+    _regex = None
+
+# Hot path regex'leri modül yüklenirken BİR kez derlenir;
+# her çağrıda re cache lookup'ı ve olası yeniden parse kalkar
+_RE_MD_JSON = re.compile(r'```json\s*')
+_RE_MD_END = re.compile(r'```\s*$')
+if _regex is not None:
+    _RE_TRAIL_COMMA_OBJ = _regex.compile(r',\s*}', flags=_regex.POSIX)
+    _RE_TRAIL_COMMA_ARR = _regex.compile(r',\s*]', flags=_regex.POSIX)
+    _RE_DBLQ = _regex.compile(r'([^\\])"([^"]*)"([^:])', flags=_regex.POSIX)
+else:
+    _RE_TRAIL_COMMA_OBJ = re.compile(r',\s*}')
+    _RE_TRAIL_COMMA_ARR = re.compile(r',\s*]')
+    _RE_DBLQ = re.compile(r'([^\\])"([^"]*)"([^:])')
+_RE_WS = re.compile(r'\s+')
+# Normalize gerektiren metni saptar: çift boşluk ya da düz boşluk dışı
+# herhangi bir \s karakteri (NBSP, em-space dahil)
+_RE_WS_PROBE = re.compile(r'\s\s|[^\S ]')
+_RE_WORDS = re.compile(r'\b\w{4,}\b')
+
+# Yaygın kelimeler - frozenset: hızlı lookup, duplicate'ler derlemede ayıklanır
+_STOP_WORDS = frozenset({'için', 'olan', 'daha', 'çok', 'gibi', 'kadar', 'sonra'})
+
+# Control karakter temizliği regex yerine translate tablosuyla:
+# tek C döngüsü, karakter başına regex motoru maliyeti yok
+_CTRL_TBL = dict.fromkeys(list(range(0x00, 0x20)) + list(range(0x7f, 0xa0)))
+
+
+def _collapse_punct(text: str) -> str:
+    """Tekrarlı . ! ? dizilerini TEK geçişte sadeleştir
+
+    Üç ayrı regex taraması yerine run'lar elle katlanır:
+    '..'+ -> '...', '!!'+ -> '!', '??'+ -> '?'
+    """
+    out = []
+    append = out.append
+    i = 0
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if ch in '.!?':
+            j = i + 1
+            while j < n and text[j] == ch:
+                j += 1
+            if j - i > 1 and ch == '.':
+                append('...')
+            else:
+                append(ch)
+            i = j
+        else:
+            append(ch)
+            i += 1
+    return ''.join(out)
+
 class JsonSafeParser:
     """Güvenli JSON parser"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        
+        # Parser nesnesi tekrar kullanılır: iç tape buffer'ı yanıtlar
+        # arası korunur, allocation churn düşer
+        self._simd_parser = simdjson.Parser() if simdjson is not None else None
+
     def safe_parse(self, response_text: str) -> Optional[Dict]:
         """Güvenli JSON parse"""
         try:
@@ -28,11 +126,28 @@ class JsonSafeParser:
             if not response_text or response_text.strip() == "":
                 self.logger.warning("Boş response alındı")
                 return None
-                
-            # Standart parse denemesi
-            return json.loads(response_text.strip())
-            
-        except json.JSONDecodeError as e:
+
+            # İlk byte { veya [ değilse (markdown sarmalı vb.) parser'ı
+            # hiç kurma, exception maliyeti ödemeden direkt repair'e git
+            stripped = response_text.strip()
+            if stripped[0] not in '{[':
+                return self._repair_and_parse(response_text)
+
+            # Standart parse denemesi: simdjson > orjson > stdlib.
+            # Hepsinin decode hatası ValueError'dan türediği için
+            # aynı except repair path'ine düşer
+            if self._simd_parser is not None:
+                doc = self._simd_parser.parse(stripped.encode('utf-8'))
+                if hasattr(doc, 'as_dict'):
+                    return doc.as_dict()
+                if hasattr(doc, 'as_list'):
+                    return doc.as_list()
+                return doc
+            if orjson is not None:
+                return orjson.loads(stripped)
+            return json.loads(stripped)
+
+        except ValueError as e:
             self.logger.warning(f"JSON parse hatası, düzeltmeye çalışılıyor: {e}")
             return self._repair_and_parse(response_text)
             
@@ -44,8 +159,8 @@ class JsonSafeParser:
                 return None
                 
             # Markdown code blocks temizle
-            cleaned = re.sub(r'```json\s*', '', text)
-            cleaned = re.sub(r'```\s*$', '', cleaned)
+            cleaned = _RE_MD_JSON.sub('', text)
+            cleaned = _RE_MD_END.sub('', cleaned)
             
             # Baş ve son boşlukları temizle
             cleaned = cleaned.strip()
@@ -84,8 +199,8 @@ class JsonSafeParser:
             except:
                 pass
                 
-            # Son çare: regex ile extraction
-            return self._extract_json_with_regex(text)
+            # Son çare: array extraction
+            return self._extract_augmented_array(text)
             
         except Exception as e:
             self.logger.error(f"JSON repair hatası: {e}")
@@ -94,53 +209,96 @@ class JsonSafeParser:
     def _aggressive_json_cleanup(self, text: str) -> str:
         """Agresif JSON temizliği"""
         # Trailing commaları temizle
-        text = re.sub(r',\s*}', '}', text)
-        text = re.sub(r',\s*]', ']', text)
-        
+        text = _RE_TRAIL_COMMA_OBJ.sub('}', text)
+        text = _RE_TRAIL_COMMA_ARR.sub(']', text)
+
         # Çift quotes düzelt
-        text = re.sub(r'([^\\])"([^"]*)"([^:])', r'\1"\2"\3', text)
-        
-        # Control characters temizle
-        text = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', text)
+        text = _RE_DBLQ.sub(r'\1"\2"\3', text)
+
+        # Control characters temizle (translate: tek sıkı C taraması)
+        text = text.translate(_CTRL_TBL)
         
         return text
         
-    def _extract_json_with_regex(self, text: str) -> Optional[Dict]:
-        """Regex ile JSON çıkarımı"""
+    def _extract_augmented_array(self, text: str) -> Optional[Dict]:
+        """Bracket dengesi sayan lineer tarama ile array çıkarımı
+
+        Eski DOTALL regex'i kötü biçimli uzun blob'larda karakter
+        karakter backtrack ediyordu; bu tek geçişli tarama string ve
+        escape farkındalığıyla eşleşen ]'yi O(n)'de bulur.
+        """
         try:
             # augmented_data array'ini bul
-            pattern = r'"augmented_data"\s*:\s*\[(.*?)\]'
-            match = re.search(pattern, text, re.DOTALL)
-            
-            if match:
-                # Basit bir array yapısı oluştur
-                return {
-                    "augmented_data": []  # Boş dön, ana script handle etsin
-                }
-                
+            idx = text.find('"augmented_data"')
+            if idx < 0:
+                return None
+            start = text.find('[', idx)
+            if start < 0:
+                return None
+
+            depth = 0
+            in_string = False
+            escaped = False
+            for pos in range(start, len(text)):
+                ch = text[pos]
+                if in_string:
+                    if escaped:
+                        escaped = False
+                    elif ch == '\\':
+                        escaped = True
+                    elif ch == '"':
+                        in_string = False
+                elif ch == '"':
+                    in_string = True
+                elif ch == '[':
+                    depth += 1
+                elif ch == ']':
+                    depth -= 1
+                    if depth == 0:
+                        try:
+                            return {"augmented_data": json.loads(text[start:pos + 1])}
+                        except ValueError:
+                            # Array bulundu ama parse edilemedi;
+                            # boş dön, ana script handle etsin
+                            return {"augmented_data": []}
+
         except Exception as e:
-            self.logger.error(f"Regex extraction hatası: {e}")
-            
+            self.logger.error(f"Array extraction hatası: {e}")
+
         return None
 
 class MemoryManager:
     """Memory yönetim sistemi"""
     
+    # virtual_memory() her çağrıda /proc/meminfo parse eder;
+    # sıkı döngüde bu TTL içinde son okunan değer yeterli
+    MEM_CACHE_TTL = 0.25
+
     def __init__(self, max_memory_percent: float = 85.0):
         self.max_memory_percent = max_memory_percent
         self.logger = logging.getLogger(__name__)
-        
+        self._mem_cache = (0.0, None)
+
+    def _virtual_memory(self, refresh: bool = False):
+        """TTL cache'li psutil.virtual_memory okuması"""
+        now = time.monotonic()
+        cached_at, memory = self._mem_cache
+        if refresh or memory is None or now - cached_at >= self.MEM_CACHE_TTL:
+            memory = psutil.virtual_memory()
+            self._mem_cache = (now, memory)
+        return memory
+
     def check_memory_usage(self):
         """Memory kullanımını kontrol et"""
         try:
-            memory = psutil.virtual_memory()
-            
+            memory = self._virtual_memory()
+
             if memory.percent > self.max_memory_percent:
                 self.logger.warning(f"Memory kullanımı yüksek: %{memory.percent:.1f}")
                 self.cleanup_memory()
-                
-                # Tekrar kontrol
-                memory_after = psutil.virtual_memory()
+
+                # Tekrar kontrol - cleanup sonrası taze okuma şart
+                memory_after = self._virtual_memory(refresh=True)
                 if memory_after.percent > self.max_memory_percent:
                     raise MemoryError(f"Memory kullanımı hala yüksek: %{memory_after.percent:.1f}")
                     
@@ -150,21 +308,18 @@ class MemoryManager:
     def cleanup_memory(self):
         """Memory temizliği"""
         try:
-            # Garbage collection
-            collected = gc.collect()
+            # Tek tam nesil taraması yeterli: ilk geçiş zaten sabit
+            # noktaya ulaşır, ekstra collect'ler sadece CPU stall'u
+            collected = gc.collect(2)
             self.logger.info(f"Garbage collection: {collected} objets cleaned")
-            
-            # Force GC
-            for i in range(3):
-                gc.collect()
-                
+
         except Exception as e:
             self.logger.error(f"Memory cleanup hatası: {e}")
             
     def get_memory_info(self) -> Dict:
         """Memory bilgilerini getir"""
         try:
-            memory = psutil.virtual_memory()
+            memory = self._virtual_memory()
             return {
                 'total_gb': memory.total / (1024**3),
                 'available_gb': memory.available / (1024**3),
@@ -177,11 +332,18 @@ class MemoryManager:
 
 class FileManager:
     """Dosya yönetim sistemi"""
-    
+
+    # Süreç genelinde bir kez oluşturulan dizinler: worker başına yeni
+    # FileManager kurulduğunda EEXIST dönen mkdir syscall'ları tekrarlanmaz
+    _ensured_dirs: set = set()
+    _ensured_lock = threading.Lock()
+
     def __init__(self, config: Dict):
         self.config = config
         self.logger = logging.getLogger(__name__)
-        
+        # batch=True ile kuyruğa alınan checkpoint yazımları
+        self._pending_writes: List[tuple] = []
+
         # Dizinleri oluştur
         self.ensure_directories()
         
@@ -195,25 +357,76 @@ class FileManager:
         ]
         
         for directory in directories:
-            os.makedirs(directory, exist_ok=True)
-            self.logger.debug(f"Dizin hazırlandı: {directory}")
+            if directory in FileManager._ensured_dirs:
+                continue
+            with FileManager._ensured_lock:
+                if directory not in FileManager._ensured_dirs:
+                    os.makedirs(directory, exist_ok=True)
+                    FileManager._ensured_dirs.add(directory)
+                    self.logger.debug(f"Dizin hazırlandı: {directory}")
             
-    def safe_write_json(self, data: Any, filepath: str, backup: bool = True):
-        """Güvenli JSON yazma"""
+    def safe_write_json(self, data: Any, filepath: str, backup: bool = True,
+                        batch: bool = False):
+        """Güvenli JSON yazma
+
+        batch=True: yazım hemen yapılmaz, flush_batch() kuyruktakileri
+        tek seferde boşaltır (checkpoint patlamaları için)
+        """
+        if batch:
+            self._pending_writes.append((data, filepath, backup))
+            return
+        self._write_one(data, filepath, backup)
+
+    def flush_batch(self):
+        """Kuyruğa alınan yazımları tek seferde boşalt
+
+        Birden çok dosya thread havuzunda paralel yazılır: dosya I/O
+        GIL'i bıraktığından submit maliyeti bir kez ödenir, bekleme
+        süreleri üst üste biner. Tek dosya için senkron yol kullanılır.
+        """
+        if not self._pending_writes:
+            return
+        pending, self._pending_writes = self._pending_writes, []
+
+        if len(pending) == 1:
+            data, filepath, backup = pending[0]
+            self._write_one(data, filepath, backup)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(4, len(pending))) as executor:
+            futures = [executor.submit(self._write_one, data, filepath, backup)
+                       for data, filepath, backup in pending]
+            for future in futures:
+                future.result()
+
+    def _write_one(self, data: Any, filepath: str, backup: bool = True):
+        """Tek dosyayı tmp+rename ile güvenli yaz"""
         try:
-            # Backup oluştur
+            # Backup oluştur - sabit .prev rotasyonu: timestamp'li dosya
+            # birikimi yerine tek yedek; os.replace her platformda atomik
             if backup and os.path.exists(filepath):
-                backup_path = f"{filepath}.backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-                os.rename(filepath, backup_path)
+                backup_path = f"{filepath}.prev"
+                os.replace(filepath, backup_path)
                 self.logger.debug(f"Backup oluşturuldu: {backup_path}")
                 
-            # Geçici dosyaya yaz
+            # Geçici dosyaya yaz (orjson: serileştirme Rust tarafında,
+            # tek bytes bloğu halinde yazılır)
             temp_path = f"{filepath}.tmp"
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            if self._has_big_list(data):
+                # Büyük listeler kayıt kayıt akıtılır: tüm çıktı buffer'ı
+                # bellekte hiç kurulmaz, peak RSS sınırlı kalır
+                self._stream_write(data, temp_path)
+            elif orjson is not None:
+                with open(temp_path, 'wb') as f:
+                    f.write(orjson.dumps(
+                        data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
                 
             # Geçici dosyayı asıl dosyaya taşı
-            os.rename(temp_path, filepath)
+            os.replace(temp_path, filepath)
             self.logger.debug(f"Dosya güvenli yazıldı: {filepath}")
             
         except Exception as e:
@@ -223,17 +436,72 @@ class FileManager:
                 os.remove(f"{filepath}.tmp")
             raise
             
+    # Bu boyuttan uzun listeler stream edilir
+    STREAM_THRESHOLD = 1000
+
+    @classmethod
+    def _has_big_list(cls, data: Any) -> bool:
+        """Büyük liste (augmented_data gibi) ya da onu içeren dict mi?
+
+        Ağır yazımların çoğu doğrudan liste gönderir (backup'lar,
+        save_final_results) - bunlar da akıtılmalı."""
+        if isinstance(data, list):
+            return len(data) >= cls.STREAM_THRESHOLD
+        return (isinstance(data, dict) and
+                any(isinstance(v, list) and len(v) >= cls.STREAM_THRESHOLD
+                    for v in data.values()))
+
+    def _stream_write(self, data: Any, temp_path: str):
+        """Veriyi yazarken büyük listeleri eleman eleman encode et
+
+        Çıktı kompakt JSON'dur: indent büyük dosyada sadece beyaz
+        boşluk maliyeti, okuyan taraf için fark etmez.
+        """
+        if orjson is not None:
+            dumps = orjson.dumps
+        else:
+            def dumps(obj):
+                return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+        def write_list(f, items):
+            f.write(b'[')
+            for item_idx, item in enumerate(items):
+                if item_idx:
+                    f.write(b',')
+                f.write(dumps(item))
+            f.write(b']')
+
+        with open(temp_path, 'wb') as f:
+            if isinstance(data, list):
+                write_list(f, data)
+                return
+            f.write(b'{')
+            for key_idx, (key, value) in enumerate(data.items()):
+                if key_idx:
+                    f.write(b',')
+                f.write(dumps(key))
+                f.write(b':')
+                if isinstance(value, list) and len(value) >= self.STREAM_THRESHOLD:
+                    write_list(f, value)
+                else:
+                    f.write(dumps(value))
+            f.write(b'}')
+
     def cleanup_old_files(self, directory: str, days: int = 7):
         """Eski dosyaları temizle"""
         try:
-            cutoff_time = datetime.now().timestamp() - (days * 24 * 60 * 60)
-            
-            for filename in os.listdir(directory):
-                filepath = os.path.join(directory, filename)
-                if os.path.isfile(filepath):
-                    if os.path.getmtime(filepath) < cutoff_time:
-                        os.remove(filepath)
-                        self.logger.debug(f"Eski dosya silindi: {filepath}")
+            # time.time(): datetime nesnesi kurmadan float epoch,
+            # mtime karşılaştırması saf float çıkarma
+            cutoff_time = time.time() - days * 86400
+
+            # scandir: tip ve mtime tek getdents çağrısından gelir,
+            # dosya başına üç ayrı stat syscall'ı yerine
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if (entry.is_file(follow_symlinks=False) and
+                            entry.stat().st_mtime < cutoff_time):
+                        os.remove(entry.path)
+                        self.logger.debug(f"Eski dosya silindi: {entry.path}")
                         
         except Exception as e:
             self.logger.error(f"Cleanup hatası: {e}")
@@ -248,114 +516,130 @@ class TextProcessor:
         """Token sayısını tahmin et"""
         # Basit tahmin: 4 karakter = 1 token
         return len(text) // 4
+
+    def estimate_tokens_batch(self, texts: List[str]):
+        """Binlerce kayıt için toplu token tahmini
+
+        numpy varsa uzunluklar tek int64 dizisine toplanıp kaydırma
+        C tarafında vektörize çalışır; yoksa comprehension (len zaten
+        O(1) C çağrısı) yeterince hızlıdır.
+        """
+        if np is not None:
+            lens = np.fromiter((len(t) for t in texts), dtype=np.int64,
+                               count=len(texts))
+            return lens >> 2
+        return [len(t) >> 2 for t in texts]
         
     def truncate_text(self, text: str, max_length: int) -> str:
         """Metni kırp"""
         if len(text) <= max_length:
             return text
-            
-        # Kelime sınırında kırp
-        truncated = text[:max_length]
-        last_space = truncated.rfind(' ')
-        
-        if last_space > max_length * 0.8:  # %80'inden fazlaysa kelime sınırında kırp
-            return truncated[:last_space] + "..."
-        else:
-            return truncated + "..."
+
+        # Kelime sınırında kırp - rfind aralığı sınırlı çalışır (C-level),
+        # ara slice kurulmaz: slice+rfind+slice yerine tek final slice
+        cut = text.rfind(' ', int(max_length * 0.8) + 1, max_length)
+        if cut >= 0:  # Son %20'lik dilimde boşluk varsa kelime sınırında kırp
+            return text[:cut] + "..."
+        return text[:max_length] + "..."
             
     def clean_text(self, text: str) -> str:
         """Metni temizle"""
-        # Çoklu boşlukları tek boşluk yap
-        text = re.sub(r'\s+', ' ', text)
-        
+        # Çoklu boşlukları tek boşluk yap - ASCII metinde memchr düzeyinde
+        # ucuz 'in' kontrolleri; ASCII dışı metinde Unicode boşluklar
+        # (NBSP, em-space - LLM/PDF kaynaklı metinde yaygın) kaçmasın
+        # diye probe regex'i karar verir
+        if text.isascii():
+            if ('  ' in text or '\t' in text or '\n' in text or '\r' in text
+                    or '\x0b' in text or '\x0c' in text):
+                text = _RE_WS.sub(' ', text)
+        elif _RE_WS_PROBE.search(text):
+            text = _RE_WS.sub(' ', text)
+
         # Baş ve son boşlukları temizle
         text = text.strip()
-        
-        # Çoklu noktalama işaretlerini düzelt
-        text = re.sub(r'[.]{2,}', '...', text)
-        text = re.sub(r'[!]{2,}', '!', text)
-        text = re.sub(r'[?]{2,}', '?', text)
+
+        # Çoklu noktalama işaretlerini düzelt (tek geçiş, sadece gerekirse)
+        if '..' in text or '!!' in text or '??' in text:
+            text = _collapse_punct(text)
         
         return text
         
     def extract_keywords(self, text: str, max_keywords: int = 5) -> List[str]:
         """Anahtar kelimeleri çıkar"""
-        # Basit keyword extraction
-        words = re.findall(r'\b\w{4,}\b', text.lower())
-        
-        # Yaygın kelimeleri filtrele
-        stop_words = {'için', 'olan', 'olan', 'daha', 'çok', 'gibi', 'kadar', 'sonra'}
-        keywords = [w for w in words if w not in stop_words]
-        
-        # Frequency count
-        word_freq = {}
-        for word in keywords:
-            word_freq[word] = word_freq.get(word, 0) + 1
-            
-        # En çok kullanılanları döndür
-        sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-        return [word[0] for word in sorted_words[:max_keywords]]
+        # Counter C-level sayar; most_common heapq.nlargest kullanır:
+        # tam sıralama yerine O(n log k). casefold İ/ı'yı doğru katlar
+        word_freq = Counter(w for w in _RE_WORDS.findall(text.casefold())
+                            if w not in _STOP_WORDS)
+        return [word for word, _ in word_freq.most_common(max_keywords)]
 
 class ProgressTracker:
     """İlerleme takip sistemi"""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        self.start_time = datetime.now().isoformat()
+        # Monotonic float: her tick'te ISO parse + timedelta aritmetiği yok
+        self._start_mono = time.monotonic()
+        self.start_time = datetime.now().isoformat()  # Sadece gösterim için
         self.progress_data = {
             'total_items': 0,
             'processed_items': 0,
             'current_batch': 0,
-            'estimated_completion': None
+            'percentage': 0.0,
+            'speed_ips': 0.0
         }
-        
+
     def update_progress(self, processed: int, total: int, current_batch: int = 0):
-        """İlerlemeyi güncelle"""
+        """İlerlemeyi güncelle
+
+        Türetilen değerler (yüzde, hız) burada bir kez materyalize
+        edilir; getter'lar araya update girmedikçe hazır değeri döner.
+        """
+        elapsed = time.monotonic() - self._start_mono
         self.progress_data.update({
             'total_items': total,
             'processed_items': processed,
-            'current_batch': current_batch
+            'current_batch': current_batch,
+            'percentage': (processed / total * 100) if total else 0.0,
+            'speed_ips': (processed / elapsed) if elapsed > 0 else 0.0
         })
-        
-        # Tahmini bitiş zamanı hesapla
-        if processed > 0:
-            start_time = datetime.fromisoformat(self.start_time)
-            elapsed = datetime.now() - start_time
-            rate = processed / elapsed.total_seconds()
-            remaining_items = total - processed
-            estimated_seconds = remaining_items / rate if rate > 0 else 0
-            
-            self.progress_data['estimated_completion'] = (
-                datetime.now() + timedelta(seconds=estimated_seconds)
-            ).isoformat()
-            
+
     def get_progress_percentage(self) -> float:
-        """İlerleme yüzdesi"""
-        if self.progress_data['total_items'] == 0:
-            return 0.0
-        return (self.progress_data['processed_items'] / self.progress_data['total_items']) * 100
-        
+        """İlerleme yüzdesi (son update'te hesaplanan değer)"""
+        return self.progress_data['percentage']
+
     def get_eta(self) -> str:
-        """Tahmini bitiş zamanı"""
-        if self.progress_data['estimated_completion']:
-            eta = datetime.fromisoformat(self.progress_data['estimated_completion'])
-            return eta.strftime('%Y-%m-%d %H:%M:%S')
-        return "Hesaplanıyor..."
-        
+        """Tahmini bitiş zamanı (lazy - sadece istendiğinde hesaplanır)"""
+        processed = self.progress_data['processed_items']
+        elapsed = time.monotonic() - self._start_mono
+        if processed <= 0 or elapsed <= 0:
+            return "Hesaplanıyor..."
+
+        rate = processed / elapsed
+        remaining_items = self.progress_data['total_items'] - processed
+        eta = datetime.now() + timedelta(seconds=remaining_items / rate)
+        return eta.strftime('%Y-%m-%d %H:%M:%S')
+
     def get_speed(self) -> str:
-        """İşlem hızı"""
-        start_time = datetime.fromisoformat(self.start_time)
-        elapsed = datetime.now() - start_time
-        if elapsed.total_seconds() > 0:
-            rate = self.progress_data['processed_items'] / elapsed.total_seconds()
-            return f"{rate:.2f} item/saniye"
-        return "0 item/saniye"
+        """İşlem hızı (son update'te hesaplanan değer)"""
+        return f"{self.progress_data['speed_ips']:.2f} item/saniye"
 
 class ConfigValidator:
     """Config doğrulama sistemi"""
-    
+
+    # Sayısal değer kontrolleri: (yol, min, max)
+    NUMERIC_CHECKS = [
+        ('safety_settings.batch_size', 1, 20),
+        ('safety_settings.delay_between_requests', 0, 60),
+        ('safety_settings.max_retries', 1, 10),
+        ('safety_settings.duplicate_threshold', 0.5, 1.0)
+    ]
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        # Yollar bir kez tuple'a parse edilir; doğrulama sırasında
+        # str.split maliyeti yok, sadece tuple üzerinde yürünür
+        self._numeric_checks = [(tuple(path.split('.')), min_val, max_val)
+                                for path, min_val, max_val in self.NUMERIC_CHECKS]
         
     def validate_config(self, config: Dict) -> bool:
         """Config'i doğrula"""
@@ -378,18 +662,13 @@ class ConfigValidator:
             if not config['api_keys'] or len(config['api_keys']) == 0:
                 raise ValueError("En az 1 API key gerekli")
                 
-            # Sayısal değer kontrolleri
-            numeric_checks = [
-                ('safety_settings.batch_size', 1, 20),
-                ('safety_settings.delay_between_requests', 0, 60),
-                ('safety_settings.max_retries', 1, 10),
-                ('safety_settings.duplicate_threshold', 0.5, 1.0)
-            ]
-            
-            for path, min_val, max_val in numeric_checks:
-                value = self._get_nested_value(config, path)
+            # Sayısal değer kontrolleri (önceden parse edilmiş yollar)
+            for keys, min_val, max_val in self._numeric_checks:
+                value = self._get_nested_value(config, keys)
                 if not isinstance(value, (int, float)) or value < min_val or value > max_val:
-                    raise ValueError(f"Geçersiz değer {path}: {value} (beklenen: {min_val}-{max_val})")
+                    raise ValueError(
+                        f"Geçersiz değer {'.'.join(keys)}: {value} "
+                        f"(beklenen: {min_val}-{max_val})")
                     
             return True
             
@@ -397,9 +676,8 @@ class ConfigValidator:
             self.logger.error(f"Config validation hatası: {e}")
             return False
             
-    def _get_nested_value(self, data: Dict, path: str):
-        """Nested dictionary'den değer al"""
-        keys = path.split('.')
+    def _get_nested_value(self, data: Dict, keys):
+        """Nested dictionary'den değer al (anahtarlar önceden parse edilmiş)"""
         value = data
         for key in keys:
             value = value[key]
@@ -8,13 +8,64 @@ Medikal doğrulama, Türkçe kontrol ve citation koruma
 import re
 import json
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Set
 from difflib import SequenceMatcher
 import hashlib
+import string
+
+try:
+    import pandas as pd  # Vektörize toplu validasyon (yoksa tek tek döngü)
+except ImportError:
+    pd = None
+
+try:
+    import regex as _regex  # POSIX modu: literal alternation'larda DFA tarama
+except ImportError:
+    _regex = None
+
+try:
+    import marisa_trie  # Statik trie: string set'ine göre 5-10x az bellek
+except ImportError:
+    marisa_trie = None
+
+try:
+    from rapidfuzz.fuzz import ratio as _rf_ratio  # C++/SIMD, SequenceMatcher'dan 20-50x hızlı
+except ImportError:
+    _rf_ratio = None
+
+
+def _compile_literal_alternation(words):
+    """Literal kelime listesini tek alternation regex'ine derle.
+    regex modülü varsa POSIX modunda: alternatif sayısından bağımsız
+    tek geçişli tarama"""
+    pattern = '|'.join(re.escape(w) for w in words)
+    if _regex is not None:
+        return _regex.compile(pattern, flags=_regex.POSIX)
+    return re.compile(pattern)
+
+try:
+    import xxhash
+
+    def _text_digest(data: bytes) -> int:
+        """64-bit içerik hash'i (SIMD hızlandırmalı xxh3)"""
+        return xxhash.xxh3_64_intdigest(data)
+except ImportError:
+    def _text_digest(data: bytes) -> int:
+        """64-bit içerik hash'i (stdlib fallback; süreç içi güvenli)"""
+        return hash(data)
 
 class MedicalValidator:
     """Medikal içerik doğrulayıcı"""
-    
+
+    # __slots__: instance başına dict yok - on binlerce validasyonda
+    # attribute erişimi hızlanır, bellek düşer
+    __slots__ = ('config', 'logger', 'dangerous_phrases',
+                 'required_medical_terms', 'medical_terminology',
+                 '_dangerous_re', '_absolute_re', '_term_re', '_term_map',
+                 '_max_answer')
+
+
     def __init__(self, config: Dict):
         self.config = config
         self.logger = logging.getLogger(__name__)
@@ -52,64 +103,132 @@ class MedicalValidator:
             "anemi": ["kansızlık"],
             "osteoporoz": ["kemik erimesi"]
         }
-        
+
+        # Regex'ler bir kez derlenir: çağrı başına re cache lookup'ı yok.
+        # Tehlikeli ifadeler tek alternation'da: C motoru metni bir kez
+        # tarar, ifade başına ayrı Python substring taraması yerine
+        self._dangerous_re = _compile_literal_alternation(self.dangerous_phrases)
+        # content zaten lower'lanmış geldiğinden IGNORECASE'e gerek yok.
+        # Üç ayrı pattern tek regex'te: metin 3 kez değil 1 kez taranır;
+        # sınırsız .*? yerine {0,60} sınırı backtracking'i kısıtlar
+        self._absolute_re = re.compile(
+            r"(?:kesinlikle\s+.{0,60}?(?:yarar|iyileşir|çalışır)"
+            r"|hiçbir zaman\s+.{0,60}?(?:zarar|yan etki)"
+            r"|%100\s+.{0,60}?(?:etkili|başarılı|kesin))")
+        # Tüm alternatifler tek regex'te: metin alternatif başına değil
+        # BİR kez taranır, ara string tahsisleri kalkar
+        term_pairs = [(alt, correct)
+                      for correct, alternatives in self.medical_terminology.items()
+                      for alt in alternatives]
+        self._term_re = re.compile(
+            '|'.join(rf"(?P<g{i}>\b{re.escape(alt)}\b)"
+                     for i, (alt, _) in enumerate(term_pairs)),
+            re.IGNORECASE)
+        self._term_map = {f'g{i}': correct
+                          for i, (_, correct) in enumerate(term_pairs)}
+
+        # Config lookup'ı çağrı başına iki dict erişimi: bir kez oku, sakla
+        self._max_answer = int(
+            config['augmentation_settings']['max_answer_length'])
+
     def validate_medical_content(self, qa_pair: Dict) -> bool:
         """Medikal içeriği doğrula"""
-        try:
-            question = qa_pair.get('soru', '').lower()
-            answer = qa_pair.get('cevap', '').lower()
-            content = f"{question} {answer}"
-            
-            # Tehlikeli ifade kontrolü
-            for dangerous in self.dangerous_phrases:
-                if dangerous in content:
-                    self.logger.warning(f"Tehlikeli ifade bulundu: {dangerous}")
-                    return False
-                    
-            # Çok kesin ifadeler kontrolü
-            absolute_patterns = [
-                r"kesinlikle\s+.*?(yarar|iyileşir|çalışır)",
-                r"hiçbir zaman\s+.*?(zarar|yan etki)",
-                r"%100\s+.*?(etkili|başarılı|kesin)"
-            ]
-            
-            for pattern in absolute_patterns:
-                if re.search(pattern, content, re.IGNORECASE):
-                    self.logger.warning(f"Çok kesin ifade bulundu: {pattern}")
-                    return False
-                    
-            # Minimum uzunluk kontrolü - GEVŞEK
-            if len(qa_pair.get('cevap', '')) < 10:
-                self.logger.warning("Cevap çok kısa")
-                return False
-                
-            # Maksimum uzunluk kontrolü
-            max_answer = self.config['augmentation_settings']['max_answer_length']
-            if len(qa_pair.get('cevap', '')) > max_answer:
-                self.logger.warning("Cevap çok uzun")
-                return False
-                
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Medikal validasyon hatası: {e}")
+        # Not: genel try/except kalktı - exception kurulumu sıcak yolda
+        # maliyet, .get() varsayılanları zaten eksik alanları karşılıyor
+        question = qa_pair.get('soru', '')
+        answer = qa_pair.get('cevap', '')
+        answer_len = len(answer)
+
+        # En ucuz kontroller önce: uzunluk zaten tutmuyorsa lower()
+        # ve regex taramalarına hiç girilmez
+
+        # Minimum uzunluk kontrolü - GEVŞEK
+        if answer_len < 10:
+            self.logger.warning("Cevap çok kısa")
+            return False
+
+        # Maksimum uzunluk kontrolü
+        if answer_len > self._max_answer:
+            self.logger.warning("Cevap çok uzun")
+            return False
+
+        # Tek lower geçişi, tek birleşik string: soru ve cevabı ayrı
+        # ayrı katlamak fazladan tarama + fazladan geçici string demek
+        content = f"{question} {answer}".lower()
+
+        # Tehlikeli ifade kontrolü (tek geçiş)
+        match = self._dangerous_re.search(content)
+        if match:
+            self.logger.warning("Tehlikeli ifade bulundu: %s", match.group(0))
             return False
+
+        # Çok kesin ifadeler kontrolü (tek geçiş)
+        match = self._absolute_re.search(content)
+        if match:
+            self.logger.warning("Çok kesin ifade bulundu: %s", match.group(0))
+            return False
+
+        return True
             
+    def validate_batch(self, qa_pairs: List[Dict]) -> List[bool]:
+        """Toplu medikal validasyon: pandas varsa kontroller Python döngüsü
+        yerine C hızında kolon operasyonlarıyla (str.len / str.contains)
+        tüm liste üzerinde tek seferde çalışır"""
+        if pd is None or not qa_pairs:
+            return [self.validate_medical_content(qa) for qa in qa_pairs]
+
+        answers = pd.Series([qa.get('cevap', '') for qa in qa_pairs])
+        ok = answers.str.len().between(10, self._max_answer)
+
+        content = (pd.Series([qa.get('soru', '') for qa in qa_pairs])
+                   + ' ' + answers).str.lower()
+        # .pattern: derlenmiş obje regex modülünden gelebilir, pandas
+        # yalnızca re.Pattern ya da string kabul eder
+        ok &= ~content.str.contains(self._dangerous_re.pattern, regex=True)
+        ok &= ~content.str.contains(self._absolute_re.pattern, regex=True)
+
+        return ok.tolist()
+
+    def validate_many(self, qa_pairs: List[Dict],
+                      chunksize: int = 500) -> List[bool]:
+        """Çok büyük listeler için çok çekirdekli validasyon: her worker
+        validator'ı (regex derlemeleri dahil) BİR kez kurar, chunk'lar
+        core'lara dağıtılır. Küçük listelerde süreç başlatma maliyeti
+        kazancı yer, tek süreçli batch yolu kullanılır"""
+        if len(qa_pairs) < 2000:
+            return self.validate_batch(qa_pairs)
+
+        chunks = [qa_pairs[i:i + chunksize]
+                  for i in range(0, len(qa_pairs), chunksize)]
+        results: List[bool] = []
+        with ProcessPoolExecutor(initializer=_init_worker_validator,
+                                 initargs=(self.config,)) as executor:
+            for part in executor.map(_validate_chunk, chunks):
+                results.extend(part)
+        return results
+
     def validate_medical_terminology(self, text: str) -> str:
-        """Medikal terminolojiyi düzelt"""
-        corrected = text
-        
-        for correct_term, alternatives in self.medical_terminology.items():
-            # Alternatif terimleri doğru terimle değiştir
-            for alt in alternatives:
-                pattern = rf"\b{re.escape(alt)}\b"
-                corrected = re.sub(pattern, correct_term, corrected, flags=re.IGNORECASE)
-                
-        return corrected
+        """Medikal terminolojiyi düzelt (tek geçişte tüm alternatifler)"""
+        return self._term_re.sub(lambda m: self._term_map[m.lastgroup], text)
+
+# Worker süreci başına tek validator: chunk başına yeniden kurulum
+# (ve regex derlemesi) yerine initializer'da bir kez
+_worker_validator: Optional[MedicalValidator] = None
+
+def _init_worker_validator(config: Dict):
+    global _worker_validator
+    _worker_validator = MedicalValidator(config)
+
+def _validate_chunk(qa_pairs: List[Dict]) -> List[bool]:
+    return [_worker_validator.validate_medical_content(qa) for qa in qa_pairs]
 
 class TurkishValidator:
     """Türkçe dil bilgisi doğrulayıcı"""
-    
+
+    __slots__ = ('logger', 'common_errors', 'capitalize_after',
+                 '_errors_re', '_errors_map')
+
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
@@ -125,39 +244,50 @@ class TurkishValidator:
         
         # Büyük harf kontrolleri
         self.capitalize_after = ['.', '!', '?']
+
+        # Tüm hatalar tek regex'te: hata başına ayrı sub geçişi yerine
+        # metin bir kez taranır
+        error_pairs = list(self.common_errors.items())
+        self._errors_re = re.compile(
+            '|'.join(rf"(?P<g{i}>\b{re.escape(wrong)}\b)"
+                     for i, (wrong, _) in enumerate(error_pairs)),
+            re.IGNORECASE)
+        self._errors_map = {f'g{i}': correct
+                            for i, (_, correct) in enumerate(error_pairs)}
         
     def validate(self, qa_pair: Dict) -> bool:
         """Türkçe validasyonu - GEVŞEK"""
-        try:
-            question = qa_pair.get('soru', '')
-            answer = qa_pair.get('cevap', '')
-            
-            # Temel kontroller - sadece boş değil mi
-            if not question or not answer:
-                return False
-                
-            # Minimum uzunluk (çok basic)
-            if len(question) < 3 or len(answer) < 10:
-                return False
-                
-            # Soru işareti kontrolü - SADECE UYAR
-            if not question.endswith('?'):
-                self.logger.debug("Soru işareti eksik (göz ardı edildi)")
-                
-            # Yaygın hata kontrolü - SADECE UYAR  
+        question = qa_pair.get('soru', '')
+        answer = qa_pair.get('cevap', '')
+
+        # Temel kontroller - sadece boş değil mi
+        if not question or not answer:
+            return False
+
+        # Minimum uzunluk (çok basic)
+        if len(question) < 3 or len(answer) < 10:
+            return False
+
+        # Soru işareti kontrolü - SADECE UYAR
+        if not question.endswith('?'):
+            self.logger.debug("Soru işareti eksik (göz ardı edildi)")
+
+        # Yaygın hata ve büyük harf kontrolleri yalnızca uyarı üretir:
+        # DEBUG kapalıyken lower() + substring taramalarına hiç girme
+        if self.logger.isEnabledFor(logging.DEBUG):
+            question_lc = question.lower()
+            answer_lc = answer.lower()
             for wrong, correct in self.common_errors.items():
-                if wrong in question.lower() or wrong in answer.lower():
-                    self.logger.debug(f"Türkçe hatası bulundu: {wrong} -> {correct} (göz ardı edildi)")
-                    
+                if wrong in question_lc or wrong in answer_lc:
+                    self.logger.debug(
+                        "Türkçe hatası bulundu: %s -> %s (göz ardı edildi)",
+                        wrong, correct)
+
             # Büyük küçük harf kontrolü - SADECE UYAR
             self._check_capitalization(question, answer)  # Warning only
-                
-            # Her şey OK - sadece çok basic kontroller
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Türkçe validasyon hatası: {e}")
-            return False
+
+        # Her şey OK - sadece çok basic kontroller
+        return True
             
     def _check_capitalization(self, question: str, answer: str) -> bool:
         """Büyük küçük harf kontrolü - SADECE UYARI"""
@@ -173,94 +303,154 @@ class TurkishValidator:
         return True
         
     def fix_turkish_errors(self, text: str) -> str:
-        """Türkçe hataları düzelt"""
-        corrected = text
-        
-        for wrong, correct in self.common_errors.items():
-            corrected = re.sub(rf"\b{wrong}\b", correct, corrected, flags=re.IGNORECASE)
-            
-        return corrected
+        """Türkçe hataları düzelt (tek geçişte tüm hatalar)"""
+        return self._errors_re.sub(lambda m: self._errors_map[m.lastgroup], text)
 
 class CitationPreserver:
     """Citation koruma sistemi"""
-    
+
+    __slots__ = ('logger', 'citation_pattern', '_citation_re')
+
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.citation_pattern = r'\[cite[^\]]*\]'
-        
+        self._citation_re = re.compile(self.citation_pattern)
+
     def extract_citations(self, text: str) -> List[str]:
         """Citation'ları çıkar"""
-        return re.findall(self.citation_pattern, text)
+        return self._citation_re.findall(text)
         
+    def _trim(self, text: str, keep: int) -> str:
+        """İlk `keep` citation'ı tutup fazlasını tek geçişte sil"""
+        seen = 0
+
+        def repl(match):
+            nonlocal seen
+            seen += 1
+            return match.group(0) if seen <= keep else ''
+
+        return self._citation_re.sub(repl, text).strip()
+
     def preserve_citations(self, original_text: str, generated_text: str) -> Dict:
         """Citation'ları koru"""
         try:
-            original_citations = self.extract_citations(original_text)
-            generated_citations = self.extract_citations(generated_text.get('cevap', ''))
-            
+            # Cevap dict'ten BİR kez okunur, sonuna kadar lokalde işlenir
+            # ve tek seferde geri yazılır
+            ans = generated_text.get('cevap', '')
+            original_citations = self._citation_re.findall(original_text)
+            generated_citations = self._citation_re.findall(ans)
+
             # Orijinalde citation var ama yenide yok
             if original_citations and not generated_citations:
                 # Random bir citation ekle
                 random_citation = original_citations[0]
-                generated_text['cevap'] += f" {random_citation}"
-                self.logger.info(f"Citation eklendi: {random_citation}")
-                
-            # Çok fazla citation varsa temizle
+                ans = f"{ans} {random_citation}"
+                self.logger.info("Citation eklendi: %s", random_citation)
+
+            # Çok fazla citation varsa temizle: citation başına ayrı
+            # .replace() geçişi (O(n*m)) yerine tek sub geçişinde ilk
+            # len(original) tanesi tutulur, fazlası atılır
             elif len(generated_citations) > len(original_citations) * 2:
-                # Fazla citation'ları temizle
-                cleaned_answer = generated_text['cevap']
-                for citation in generated_citations[len(original_citations):]:
-                    cleaned_answer = cleaned_answer.replace(citation, '', 1)
-                generated_text['cevap'] = cleaned_answer.strip()
-                
+                ans = self._trim(ans, len(original_citations))
+
+            generated_text['cevap'] = ans
             return generated_text
-            
+
         except Exception as e:
-            self.logger.error(f"Citation koruma hatası: {e}")
+            self.logger.error("Citation koruma hatası: %s", e)
             return generated_text
 
 class DuplicateDetector:
     """Duplicate detection sistemi"""
-    
+
+    __slots__ = ('threshold', 'logger', 'database', '_database_trie',
+                 'question_hashes', '_punct_tbl', '_punct_bdel', '_punct_re',
+                 '_shingles', '_shingle_union')
+
+
     def __init__(self, threshold: float = 0.85):
         self.threshold = threshold
         self.logger = logging.getLogger(__name__)
+        # Soru metinleri: marisa-trie varsa buffer periyodik olarak statik
+        # trie'ye katlanır (trie immutable olduğundan doğrudan insert yok);
+        # yoksa düz set olarak kalır
         self.database: Set[str] = set()
-        self.question_hashes: Set[str] = set()
-        
-    def get_text_hash(self, text: str) -> str:
-        """Metin hash'i oluştur"""
-        # Noktalama ve boşlukları temizle
-        cleaned = re.sub(r'[^\w\s]', '', text.lower())
+        self._database_trie = None
+        self.question_hashes: Set[int] = set()
+        # ASCII noktalama için C hızında translate tablosu; tablo dışı
+        # unicode noktalama (tipografik tırnak vb.) regex ile süpürülür.
+        # '_' tabloda YOK: regex'teki \w alt çizgiyi korur
+        self._punct_tbl = str.maketrans(
+            '', '', string.punctuation.replace('_', ''))
+        # ASCII metin için bytes seviyesinde silme tablosu: encode/decode
+        # gidiş-gelişi olmadan tek translate + split
+        self._punct_bdel = string.punctuation.replace('_', '').encode('ascii')
+        self._punct_re = re.compile(r'[^\w\s]')
+        # Soru başına 4-gram shingle seti: benzerlik kontrolü
+        # SequenceMatcher yerine set kesişimi (Jaccard) ile yapılır
+        self._shingles: Dict[int, frozenset] = {}
+        # Tüm kayıtlı shingle'ların birleşimi - bloom filtre tarzı ön
+        # eleme: Jaccard(s, e) <= |s ∩ birleşim| / |s| olduğundan bu üst
+        # sınır eşiğin altındaysa soru başına döngüye hiç girilmez
+        self._shingle_union: Set[str] = set()
+
+    @staticmethod
+    def _shingle_set(text: str) -> frozenset:
+        """Karakter 4-gram shingle seti"""
+        if len(text) < 4:
+            return frozenset((text,))
+        return frozenset(text[i:i + 4] for i in range(len(text) - 3))
+
+    def get_text_hash(self, text: str) -> int:
+        """Metin hash'i oluştur (64-bit int: set üyeliği için MD5 +
+        hexdigest string tahsisi gereksiz)"""
+        # ASCII hızlı yol: tamamen bytes üzerinde (lower + translate +
+        # split), unicode tablolarına hiç girmeden
+        if text.isascii():
+            b = text.lower().encode('ascii').translate(None, self._punct_bdel)
+            return _text_digest(b' '.join(b.split()))
+
+        # Noktalama ve boşlukları temizle: önce translate (ASCII noktalama,
+        # tek C geçişi), regex yalnızca tablo dışında sembol kalırsa
+        cleaned = text.lower().translate(self._punct_tbl)
+        if not cleaned.isascii() and self._punct_re.search(cleaned):
+            cleaned = self._punct_re.sub('', cleaned)
         cleaned = ' '.join(cleaned.split())
-        return hashlib.md5(cleaned.encode('utf-8')).hexdigest()
+        return _text_digest(cleaned.encode('utf-8'))
         
     def calculate_similarity(self, text1: str, text2: str) -> float:
         """İki metin arasındaki benzerlik"""
+        if _rf_ratio is not None:
+            return _rf_ratio(text1, text2, processor=str.lower) / 100.0
         return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
         
     def is_duplicate(self, qa_pair: Dict) -> bool:
         """Duplicate kontrolü"""
-        try:
-            question = qa_pair.get('soru', '')
-            question_hash = self.get_text_hash(question)
-            
-            # Exact match kontrolü
-            if question_hash in self.question_hashes:
-                self.logger.warning(f"Duplicate bulundu (exact): {question[:50]}...")
-                return True
-                
-            # Similarity kontrolü
-            for existing_hash in self.question_hashes:
-                # Bu tam doğru değil ama basit bir kontrol
-                # Gerçek implementasyonda tüm soruları saklamalıyız
-                pass
-                
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"Duplicate detection hatası: {e}")
+        question = qa_pair.get('soru', '')
+        question_hash = self.get_text_hash(question)
+
+        # Exact match kontrolü
+        if question_hash in self.question_hashes:
+            self.logger.warning("Duplicate bulundu (exact): %.50s...", question)
+            return True
+
+        # Similarity kontrolü: Jaccard = |kesişim| / |birleşim|,
+        # hash hızında set aritmetiği; eşik aşılır aşılmaz çık
+        shingles = self._shingle_set(question.lower())
+
+        # Ön eleme: birleşimdeki isabet oranı eşiğe ulaşamıyorsa hiçbir
+        # kayıtlı set de ulaşamaz (üst sınır) -> tüm döngü atlanır
+        if len(shingles & self._shingle_union) < self.threshold * len(shingles):
             return False
+
+        for existing in self._shingles.values():
+            union = len(shingles | existing)
+            if union and len(shingles & existing) / union >= self.threshold:
+                self.logger.warning("Duplicate bulundu (similar): %.50s...", question)
+                return True
+
+        return False
             
     def add_to_database(self, qa_pair: Dict):
         """Veritabanına ekle"""
@@ -268,46 +458,72 @@ class DuplicateDetector:
             question = qa_pair.get('soru', '')
             question_hash = self.get_text_hash(question)
             self.question_hashes.add(question_hash)
-            
+            shingle_set = self._shingle_set(question.lower())
+            self._shingles[question_hash] = shingle_set
+            self._shingle_union.update(shingle_set)
+
             # Full text de sakla (memory için dikkatli)
-            if len(self.database) < 10000:  # Memory limit
+            if self._database_size() < 10000:  # Memory limit
                 self.database.add(question.lower())
-                
+                # Buffer dolunca trie'ye katla: ham stringler bırakılır
+                if marisa_trie is not None and len(self.database) >= 1000:
+                    self._compact_database()
+
         except Exception as e:
-            self.logger.error(f"Database ekleme hatası: {e}")
-            
+            self.logger.error("Database ekleme hatası: %s", e)
+
+    def _database_size(self) -> int:
+        """Saklanan toplam soru sayısı (buffer + trie)"""
+        trie_size = len(self._database_trie) if self._database_trie else 0
+        return len(self.database) + trie_size
+
+    def _compact_database(self):
+        """Set buffer'ını statik marisa trie'ye katla"""
+        try:
+            keys = list(self.database)
+            if self._database_trie is not None:
+                keys.extend(self._database_trie.keys())
+            self._database_trie = marisa_trie.Trie(keys)
+            self.database.clear()
+        except Exception as e:
+            self.logger.error("Trie compaction hatası: %s", e)
+
     def get_stats(self) -> Dict:
         """İstatistikleri getir"""
         return {
             "total_questions": len(self.question_hashes),
-            "database_size": len(self.database),
+            "database_size": self._database_size(),
             "threshold": self.threshold
         }
 
 class ContentFilter:
     """İçerik filtreleme sistemi"""
-    
+
+    __slots__ = ('logger', 'inappropriate_words', '_inappropriate_re')
+
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
-        
+
         # Uygunsuz kelimeler (çok basit bir liste)
         self.inappropriate_words = [
             # Türkçe küfürler (örnek - genişletilebilir)
             "aptallık", "saçmalık", "gerizekalı"
         ]
-        
+
+        # Tek alternation regex: liste uzunluğundan bağımsız tek geçişli
+        # tarama. Substring semantiği bilinçli: kelimeler kök halinde,
+        # çekimli biçimler ("saçmalıktır") ancak böyle yakalanır
+        self._inappropriate_re = _compile_literal_alternation(
+            self.inappropriate_words)
+
     def filter_content(self, qa_pair: Dict) -> bool:
         """İçerik filtrele"""
-        try:
-            content = f"{qa_pair.get('soru', '')} {qa_pair.get('cevap', '')}".lower()
-            
-            for word in self.inappropriate_words:
-                if word in content:
-                    self.logger.warning(f"Uygunsuz kelime bulundu: {word}")
-                    return False
-                    
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Content filter hatası: {e}")
-            return True  # Hata durumunda geçir 
\ No newline at end of file
+        content = f"{qa_pair.get('soru', '')} {qa_pair.get('cevap', '')}".lower()
+
+        match = self._inappropriate_re.search(content)
+        if match:
+            self.logger.warning("Uygunsuz kelime bulundu: %s", match.group(0))
+            return False
+
+        return True 
\ No newline at end of file
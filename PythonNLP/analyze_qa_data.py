@@ -6,28 +6,91 @@ Soru-Cevap Verileri Analiz ve Dönüştürme Aracı
 Bu script oluşturulan soru-cevap verilerini analiz eder ve farklı formatlara dönüştürür.
 """
 
+import csv
 import json
-import pandas as pd
 import os
+import re
 from collections import Counter
-from typing import List, Dict
+from itertools import islice
+from typing import Dict, Iterator, List
+
+try:
+    import ijson  # Akış halinde parse: dosya RAM'e topluca yüklenmez
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Rust tabanlı encode/decode, stdlib json'dan 3-10x hızlı
+except ImportError:
+    orjson = None
+
+# Kelime sayımı için: len(text.split()) kelime başına substring nesnesi
+# tahsis eder; finditer aynı sonucu sıfır liste tahsisiyle verir
+_WORD_RE = re.compile(r'\S+')
+
+def _wc(text: str) -> int:
+    """Kelime sayısı (split ile birebir aynı semantik, tahsissiz)"""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+class _QAStream:
+    """JSON dizisini diskten kayıt kayıt akıtan tembel veri kaynağı.
+
+    Liste gibi kullanılabilir (iter/len/bool) ama hiçbir anda tek
+    kayıttan fazlası bellekte tutulmaz; her iterasyon dosyayı baştan açar.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._count = None
+
+    def __iter__(self) -> Iterator[Dict]:
+        count = 0
+        try:
+            with open(self.path, 'rb') as f:
+                for item in ijson.items(f, 'item'):
+                    count += 1
+                    yield item
+        except Exception as e:
+            print(f"❌ JSON akış hatası: {e}")
+            return
+        self._count = count
+
+    def __len__(self) -> int:
+        if self._count is None:
+            self._count = sum(1 for _ in self)
+        return self._count
+
+    def __bool__(self) -> bool:
+        if self._count is not None:
+            return self._count > 0
+        for _ in self:
+            return True
+        return False
 
 class QAAnalyzer:
     def __init__(self, qa_file: str):
         self.qa_file = qa_file
         self.qa_data = self.load_qa_data()
-    
+
     def load_qa_data(self) -> List[Dict]:
-        """Soru-cevap verilerini yükler"""
+        """Soru-cevap verilerini yükler (ijson varsa akış halinde:
+        çoklu-GB dosyalar için bellek kullanımı tek kayıt boyutunda kalır)"""
+        if ijson is not None and os.path.exists(self.qa_file):
+            print(f"✅ Veriler akış halinde okunacak: {self.qa_file}")
+            return _QAStream(self.qa_file)
         try:
-            with open(self.qa_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(self.qa_file, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(self.qa_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             print(f"✅ {len(data)} soru-cevap çifti yüklendi")
             return data
         except FileNotFoundError:
             print(f"❌ {self.qa_file} dosyası bulunamadı!")
             return []
-        except json.JSONDecodeError as e:
+        except ValueError as e:  # orjson.JSONDecodeError da ValueError'dur
             print(f"❌ JSON parse hatası: {e}")
             return []
     
@@ -39,32 +102,48 @@ class QAAnalyzer:
         
         print("\n📊 VERİ ANALİZİ")
         print("=" * 30)
-        
-        # Toplam sayılar
-        total_qa = len(self.qa_data)
+
+        # Tek geçişte tüm istatistikler: ayrı ayrı sources/uzunluk
+        # listeleri (N eleman x 3 liste) yerine koşan sayaçlar - veri
+        # akıştan geliyorsa dosya da yalnızca BİR kez okunur
+        source_counts = Counter()
+        total_qa = 0
+        sum_q = sum_a = 0
+        min_q = min_a = None
+        max_q = max_a = 0
+
+        for item in self.qa_data:
+            total_qa += 1
+            source_counts[item.get('kaynak', 'Bilinmeyen')] += 1
+
+            q_len = _wc(item.get('soru', ''))
+            a_len = _wc(item.get('cevap', ''))
+            sum_q += q_len
+            sum_a += a_len
+            if min_q is None or q_len < min_q:
+                min_q = q_len
+            if q_len > max_q:
+                max_q = q_len
+            if min_a is None or a_len < min_a:
+                min_a = a_len
+            if a_len > max_a:
+                max_a = a_len
+
         print(f"Toplam Soru-Cevap Çifti: {total_qa}")
-        
-        # Kaynak analizi
-        sources = [item.get('kaynak', 'Bilinmeyen') for item in self.qa_data]
-        source_counts = Counter(sources)
-        
+
         print(f"\nKaynak Dağılımı:")
         for source, count in source_counts.most_common(10):
             print(f"  {source}: {count} adet")
-        
-        # Soru uzunluk analizi
-        question_lengths = [len(item.get('soru', '').split()) for item in self.qa_data]
-        answer_lengths = [len(item.get('cevap', '').split()) for item in self.qa_data]
-        
+
         print(f"\nSoru İstatistikleri:")
-        print(f"  Ortalama kelime sayısı: {sum(question_lengths)/len(question_lengths):.1f}")
-        print(f"  En kısa soru: {min(question_lengths)} kelime")
-        print(f"  En uzun soru: {max(question_lengths)} kelime")
-        
+        print(f"  Ortalama kelime sayısı: {sum_q/total_qa:.1f}")
+        print(f"  En kısa soru: {min_q} kelime")
+        print(f"  En uzun soru: {max_q} kelime")
+
         print(f"\nCevap İstatistikleri:")
-        print(f"  Ortalama kelime sayısı: {sum(answer_lengths)/len(answer_lengths):.1f}")
-        print(f"  En kısa cevap: {min(answer_lengths)} kelime")
-        print(f"  En uzun cevap: {max(answer_lengths)} kelime")
+        print(f"  Ortalama kelime sayısı: {sum_a/total_qa:.1f}")
+        print(f"  En kısa cevap: {min_a} kelime")
+        print(f"  En uzun cevap: {max_a} kelime")
     
     def export_to_csv(self, output_file: str = "qa_pairs_export.csv"):
         """CSV formatına dönüştürür"""
@@ -72,9 +151,20 @@ class QAAnalyzer:
             print("❌ Dönüştürülecek veri bulunamadı!")
             return
         
-        df = pd.DataFrame(self.qa_data)
-        df.to_csv(output_file, index=False, encoding='utf-8')
-        print(f"✅ CSV dosyası oluşturuldu: {output_file}")
+        # pandas DataFrame kurulumu (kolon transpozu + ~400ms import)
+        # yerine csv.DictWriter satır satır akıtır: O(1) bellek
+        count = 0
+        with open(output_file, 'w', newline='', encoding='utf-8',
+                  buffering=1 << 20) as f:
+            writer = None
+            for item in self.qa_data:
+                if writer is None:
+                    writer = csv.DictWriter(f, fieldnames=list(item.keys()),
+                                            extrasaction='ignore', restval='')
+                    writer.writeheader()
+                writer.writerow(item)
+                count += 1
+        print(f"✅ CSV dosyası oluşturuldu: {output_file} ({count} satır)")
     
     def export_to_training_format(self, output_file: str = "training_data.jsonl"):
         """AI eğitimi için uygun formata dönüştürür"""
@@ -82,21 +172,36 @@ class QAAnalyzer:
             print("❌ Dönüştürülecek veri bulunamadı!")
             return
         
-        training_data = []
-        for item in self.qa_data:
-            training_format = {
-                "instruction": item.get('soru', ''),
-                "input": "",
-                "output": item.get('cevap', ''),
-                "source": item.get('kaynak', '')
-            }
-            training_data.append(training_format)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            for item in training_data:
-                f.write(json.dumps(item, ensure_ascii=False) + '\n')
-        
-        print(f"✅ Eğitim verisi oluşturuldu: {output_file}")
+        # Ara training_data listesi yok: her satır okunduğu anda dosyaya
+        # yazılır (O(1) bellek); 1 MiB tampon write() syscall sayısını
+        # varsayılan 8 KiB'e göre ~128x azaltır
+        count = 0
+        if orjson is not None:
+            # orjson bytes üretir ve her zaman UTF-8 yazar
+            # (ensure_ascii=False ile eşdeğer)
+            with open(output_file, 'wb', buffering=1 << 20) as f:
+                for item in self.qa_data:
+                    f.write(orjson.dumps({
+                        "instruction": item.get('soru', ''),
+                        "input": "",
+                        "output": item.get('cevap', ''),
+                        "source": item.get('kaynak', '')
+                    }))
+                    f.write(b'\n')
+                    count += 1
+        else:
+            with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                for item in self.qa_data:
+                    training_format = {
+                        "instruction": item.get('soru', ''),
+                        "input": "",
+                        "output": item.get('cevap', ''),
+                        "source": item.get('kaynak', '')
+                    }
+                    f.write(json.dumps(training_format, ensure_ascii=False) + '\n')
+                    count += 1
+
+        print(f"✅ Eğitim verisi oluşturuldu: {output_file} ({count} kayıt)")
     
     def create_topic_groups(self, output_file: str = "qa_by_topics.json"):
         """Konulara göre gruplandırır"""
@@ -112,9 +217,15 @@ class QAAnalyzer:
                 grouped_data[source] = []
             grouped_data[source].append(item)
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(grouped_data, f, ensure_ascii=False, indent=2)
-        
+        # 1 MiB tampon: varsayılan 8 KiB'e göre ~128x daha az write() syscall
+        if orjson is not None:
+            with open(output_file, 'wb', buffering=1 << 20) as f:
+                f.write(orjson.dumps(grouped_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8',
+                      buffering=1 << 20) as f:
+                json.dump(grouped_data, f, ensure_ascii=False, indent=2)
+
         print(f"✅ Konulara göre gruplandırılmış veri: {output_file}")
     
     def filter_quality_data(self, min_answer_length: int = 10, output_file: str = "quality_qa_pairs.json"):
@@ -124,21 +235,28 @@ class QAAnalyzer:
             return
         
         quality_data = []
+        total = 0
         for item in self.qa_data:
+            total += 1
             question = item.get('soru', '')
             answer = item.get('cevap', '')
-            
+
             # Kalite kriterleri
-            if (len(answer.split()) >= min_answer_length and 
-                len(question.split()) >= 5 and
+            if (_wc(answer) >= min_answer_length and
+                _wc(question) >= 5 and
                 '?' in question and
                 len(answer) > len(question)):
                 quality_data.append(item)
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(quality_data, f, ensure_ascii=False, indent=2)
-        
-        print(f"✅ Kaliteli veri filtresi: {len(quality_data)}/{len(self.qa_data)} çift seçildi")
+
+        if orjson is not None:
+            with open(output_file, 'wb', buffering=1 << 20) as f:
+                f.write(orjson.dumps(quality_data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w', encoding='utf-8',
+                      buffering=1 << 20) as f:
+                json.dump(quality_data, f, ensure_ascii=False, indent=2)
+
+        print(f"✅ Kaliteli veri filtresi: {len(quality_data)}/{total} çift seçildi")
         print(f"   Dosya: {output_file}")
     
     def show_sample_data(self, count: int = 3):
@@ -150,7 +268,8 @@ class QAAnalyzer:
         print(f"\n📝 ÖRNEK VERİLER (İlk {count} adet)")
         print("=" * 50)
         
-        for i, item in enumerate(self.qa_data[:count]):
+        # islice: hem liste hem akış kaynağında ilk `count` kaydı alır
+        for i, item in enumerate(islice(self.qa_data, count)):
             print(f"\n[{i+1}] Kaynak: {item.get('kaynak', 'Bilinmeyen')}")
             print(f"Soru: {item.get('soru', 'Soru bulunamadı')}")
             print(f"Cevap: {item.get('cevap', 'Cevap bulunamadı')[:200]}...")
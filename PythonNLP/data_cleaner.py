@@ -9,9 +9,61 @@ JSON dosyasındaki soru-cevap çiftlerini analiz eder ve kalitesiz verileri temi
 import json
 import re
 import os
+import multiprocessing as mp
+from functools import partial
 from typing import List, Dict, Tuple
 from collections import Counter
 
+try:
+    import ijson  # Akış halinde parse: dosya RAM'e topluca yüklenmez
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # Rust tabanlı encode/decode, stdlib json'dan 3-10x hızlı
+except ImportError:
+    orjson = None
+
+try:
+    from datasketch import MinHash, MinHashLSH  # Yakın-duplicate için LSH index
+except ImportError:
+    MinHash = None  # Fallback: N x N tarama
+    MinHashLSH = None
+
+try:
+    import pandas as pd  # Temel kontrollerin vektörize ön filtresi için
+except ImportError:
+    pd = None
+
+DEDUP_NUM_PERM = 64
+
+# Bu boyutun altında süreç havuzu kurulum maliyeti kazancı yer
+PARALLEL_MIN_ITEMS = 10000
+
+# Kelime sayımı için: len(text.split()) kelime başına substring nesnesi
+# tahsis eder; finditer aynı sonucu sıfır liste tahsisiyle verir
+_WORD_RE = re.compile(r'\S+')
+
+def _wc(text: str) -> int:
+    """Kelime sayısı (split ile birebir aynı semantik, tahsissiz)"""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+def _find_overrepeated(tokens: List[str], threshold: int):
+    """Eşikten fazla tekrar eden ilk kelimeyi (kelime, sayı) döndürür.
+
+    Counter tüm tokenleri sayıp ikinci bir .items() geçişi yapar; burada
+    sayaç eşiği aşar aşmaz çıkılır - tekrar içermeyen çoğunluk için tam
+    dict kurulum maliyeti ödenmez.
+    """
+    counts = {}
+    for word in tokens:
+        if len(word) > 3:
+            c = counts.get(word, 0) + 1
+            if c > threshold:
+                return word, c
+            counts[word] = c
+    return None
+
 class DataCleaner:
     def __init__(self):
         """Veri temizleyici sınıfını başlatır"""
@@ -39,36 +91,69 @@ class DataCleaner:
             r'grafik \d+', # Grafik numarası
             r'resim \d+',  # Resim numarası
         ]
-        
-        # Geçersiz soru başlangıçları
-        self.invalid_question_starts = [
+
+        # Tüm pattern'ler tek alternation'da bir kez derlenir: çift başına
+        # 11 pattern x 2 alan = 22 ayrı re.search kurulumu yerine alan
+        # başına tek tarama
+        self._bad_re = re.compile(
+            '|'.join(f'(?:{p})' for p in self.bad_patterns), re.IGNORECASE)
+
+
+        # Geçersiz soru başlangıçları (frozenset: listede lineer tarama
+        # yerine O(1) üyelik testi)
+        self.invalid_question_starts = frozenset([
             'bu', 'şu', 'o', 'bunlar', 'şunlar', 'onlar',
             'burada', 'şurada', 'orada', 'yukarıda', 'aşağıda'
-        ]
-        
+        ])
+
         # Sık tekrar eden gereksiz kelimeler
-        self.stop_words = [
+        self.stop_words = frozenset([
             'çok', 'daha', 'en', 'bir', 'bu', 'şu', 'o', 've', 'ile', 'için',
             'gibi', 'kadar', 'sonra', 'önce', 'üzere', 'dolayı', 'rağmen'
-        ]
+        ])
+
+        # Genel cevap kalıpları tek regex'te: kalıp başına 9 ayrı substring
+        # taraması yerine cevap bir kez taranır (\b ile tam kelime)
+        self._generic_re = re.compile(
+            r'\b(?:evet|hayır|bilmiyorum|belki|muhtemelen'
+            r'|önemlidir|gereklidir|faydalıdır|zararlıdır)\b')
 
     def load_data(self, file_path: str) -> List[Dict]:
         """JSON dosyasından verileri yükler"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if orjson is not None:
+                with open(file_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             print(f"✅ {len(data)} soru-cevap çifti yüklendi")
             return data
         except FileNotFoundError:
             print(f"❌ {file_path} dosyası bulunamadı!")
             return []
-        except json.JSONDecodeError:
+        except ValueError:  # orjson.JSONDecodeError da ValueError'dur
             print(f"❌ {file_path} geçerli bir JSON dosyası değil!")
             return []
         except Exception as e:
             print(f"❌ Veri yükleme hatası: {e}")
             return []
 
+    def stream_load_data(self, file_path: str):
+        """Kayıtları diskten akış halinde üretir: ijson varsa dosya hiçbir
+        anda topluca belleğe alınmaz, clean_data iterable'ı doğrudan tüketir.
+        ijson yoksa load_data'nın liste yolu üzerinden akıtılır."""
+        if ijson is None:
+            yield from self.load_data(file_path)
+            return
+        try:
+            with open(file_path, 'rb') as f:
+                yield from ijson.items(f, 'item')
+        except FileNotFoundError:
+            print(f"❌ {file_path} dosyası bulunamadı!")
+        except Exception as e:
+            print(f"❌ JSON akış hatası: {e}")
+
     def check_basic_quality(self, qa_pair: Dict) -> Tuple[bool, List[str]]:
         """Temel kalite kontrolü yapar"""
         issues = []
@@ -100,8 +185,8 @@ class DataCleaner:
             issues.append(f"Cevap çok uzun ({len(answer)} karakter)")
         
         # Kelime sayısı kontrolü
-        question_words = len(question.split())
-        answer_words = len(answer.split())
+        question_words = _wc(question)
+        answer_words = _wc(answer)
         
         if question_words < self.quality_rules['min_word_count_question']:
             issues.append(f"Soru çok az kelime ({question_words} kelime)")
@@ -115,56 +200,115 @@ class DataCleaner:
         
         return len(issues) == 0, issues
 
-    def check_content_quality(self, qa_pair: Dict) -> Tuple[bool, List[str]]:
-        """İçerik kalitesi kontrolü yapar"""
+    def _prefilter_basic(self, data: List[Dict], stats: Dict) -> List[Dict]:
+        """Temel kalite aşamasını pandas ile vektörize eder: uzunluk ve
+        kelime sayısı karşılaştırmaları çift başına Python çağrıları yerine
+        tüm veri üzerinde tek seferde C hızında boolean maskelerle yapılır"""
+        rules = self.quality_rules
+        issues_summary = stats['issues_summary']
+
+        # Eksik alanlı çiftler (nadir) vektörize akışa girmeden elenir
+        rows = []
+        for qa_pair in data:
+            if 'soru' not in qa_pair or 'cevap' not in qa_pair:
+                stats['basic_quality_failed'] += 1
+                issues_summary['Eksik alan (soru/cevap)'] += 1
+            else:
+                rows.append(qa_pair)
+
+        if not rows:
+            return rows
+
+        question = pd.Series([qa['soru'] for qa in rows]).str.strip()
+        answer = pd.Series([qa['cevap'] for qa in rows]).str.strip()
+        q_len = question.str.len()
+        a_len = answer.str.len()
+        q_wc = question.str.split().str.len()
+        a_wc = answer.str.split().str.len()
+
+        # Her kriter bir boolean kolon; birleşik maske tek logical-and
+        checks = [
+            ((q_len > 0) & (a_len > 0), 'Boş soru veya cevap'),
+            (q_len >= rules['min_question_length'], 'Soru çok kısa'),
+            (a_len >= rules['min_answer_length'], 'Cevap çok kısa'),
+            (q_len <= rules['max_question_length'], 'Soru çok uzun'),
+            (a_len <= rules['max_answer_length'], 'Cevap çok uzun'),
+            (q_wc >= rules['min_word_count_question'], 'Soru çok az kelime'),
+            (a_wc >= rules['min_word_count_answer'], 'Cevap çok az kelime'),
+            (a_len >= q_len * rules['answer_question_ratio'],
+             'Cevap soruya göre çok kısa'),
+        ]
+
+        mask = checks[0][0]
+        for check, _ in checks[1:]:
+            mask &= check
+        for check, label in checks:
+            failed = int((~check).sum())
+            if failed:
+                issues_summary[label] += failed
+
+        stats['basic_quality_failed'] += int((~mask).sum())
+        return [qa for qa, keep in zip(rows, mask.tolist()) if keep]
+
+    def check_content_quality(self, qa_pair: Dict, question: str = None,
+                              answer: str = None, q_tokens: List[str] = None,
+                              a_tokens: List[str] = None) -> Tuple[bool, List[str]]:
+        """İçerik kalitesi kontrolü yapar
+
+        clean_data lower/split sonuçlarını bir kez hesaplayıp geçirir;
+        doğrudan çağrılar için parametresiz kullanım aynen çalışır.
+        """
         issues = []
-        question = qa_pair['soru'].strip().lower()
-        answer = qa_pair['cevap'].strip().lower()
-        
-        # Kötü pattern kontrolü
-        for pattern in self.bad_patterns:
-            if re.search(pattern, question, re.IGNORECASE):
-                issues.append(f"Soruda geçersiz pattern: {pattern}")
-            if re.search(pattern, answer, re.IGNORECASE):
-                issues.append(f"Cevapta geçersiz pattern: {pattern}")
-        
+        if question is None:
+            question = qa_pair['soru'].strip().lower()
+            answer = qa_pair['cevap'].strip().lower()
+            q_tokens = question.split()
+            a_tokens = answer.split()
+
+        # Kötü pattern kontrolü (alan başına tek birleşik tarama)
+        match = self._bad_re.search(question)
+        if match:
+            issues.append(f"Soruda geçersiz pattern: {match.group(0)!r}")
+        match = self._bad_re.search(answer)
+        if match:
+            issues.append(f"Cevapta geçersiz pattern: {match.group(0)!r}")
+
         # Soru işareti kontrolü
         if '?' not in qa_pair['soru']:
             issues.append("Soruda soru işareti yok")
-        
+
         # Geçersiz soru başlangıcı kontrolü
-        first_word = question.split()[0] if question.split() else ""
+        first_word = q_tokens[0] if q_tokens else ""
         if first_word in self.invalid_question_starts:
             issues.append(f"Geçersiz soru başlangıcı: {first_word}")
-        
-        # Tekrar eden kelime kontrolü
-        question_words = question.split()
-        answer_words = answer.split()
-        
-        # Soruda aynı kelimenin çok tekrarı
-        question_word_counts = Counter(question_words)
-        for word, count in question_word_counts.items():
-            if count > 3 and len(word) > 3:
-                issues.append(f"Soruda '{word}' kelimesi çok tekrar ediyor ({count} kez)")
-        
+
+        # Soruda aynı kelimenin çok tekrarı (ilk ihlalde çıkan tek geçiş)
+        hit = _find_overrepeated(q_tokens, 3)
+        if hit:
+            issues.append(f"Soruda '{hit[0]}' kelimesi çok tekrar ediyor ({hit[1]} kez)")
+
         # Cevapta aynı kelimenin çok tekrarı
-        answer_word_counts = Counter(answer_words)
-        for word, count in answer_word_counts.items():
-            if count > 5 and len(word) > 3:
-                issues.append(f"Cevapta '{word}' kelimesi çok tekrar ediyor ({count} kez)")
-        
+        hit = _find_overrepeated(a_tokens, 5)
+        if hit:
+            issues.append(f"Cevapta '{hit[0]}' kelimesi çok tekrar ediyor ({hit[1]} kez)")
+
         return len(issues) == 0, issues
 
-    def check_semantic_quality(self, qa_pair: Dict) -> Tuple[bool, List[str]]:
+    def check_semantic_quality(self, qa_pair: Dict, question: str = None,
+                               answer: str = None, q_tokens: List[str] = None,
+                               a_tokens: List[str] = None) -> Tuple[bool, List[str]]:
         """Anlamsal kalite kontrolü yapar"""
         issues = []
-        question = qa_pair['soru'].strip().lower()
-        answer = qa_pair['cevap'].strip().lower()
-        
+        if question is None:
+            question = qa_pair['soru'].strip().lower()
+            answer = qa_pair['cevap'].strip().lower()
+            q_tokens = question.split()
+            a_tokens = answer.split()
+
         # Soru ve cevap arasında anlamsal bağlantı kontrolü
-        question_words = set(question.split())
-        answer_words = set(answer.split())
-        
+        question_words = set(q_tokens)
+        answer_words = set(a_tokens)
+
         # Ortak kelime oranı
         common_words = question_words.intersection(answer_words)
         common_ratio = len(common_words) / len(question_words) if question_words else 0
@@ -176,25 +320,51 @@ class DataCleaner:
         if question.replace('?', '').strip() in answer:
             issues.append("Cevap soruyu aynen tekrar ediyor")
         
-        # Çok genel cevaplar
-        generic_answers = [
-            'evet', 'hayır', 'bilmiyorum', 'belki', 'muhtemelen',
-            'önemlidir', 'gereklidir', 'faydalıdır', 'zararlıdır'
-        ]
-        
-        if any(generic in answer for generic in generic_answers) and len(answer.split()) < 10:
+        # Çok genel cevaplar: ucuz uzunluk kontrolü önce, regex yalnızca
+        # kısa cevaplarda çalışır
+        if len(a_tokens) < 10 and self._generic_re.search(answer):
             issues.append("Çok genel/kısa cevap")
         
         return len(issues) == 0, issues
 
     def detect_duplicates(self, data: List[Dict]) -> List[int]:
         """Tekrar eden soru-cevap çiftlerini tespit eder"""
-        seen_questions = {}
         duplicates = []
-        
+
+        # 1. katman: normalize edilmiş anahtarla birebir tekrarlar.
+        # Kelimeler sıralanır ki aynı kelimelerin farklı dizilişi de
+        # yakalansın; set lookup'ı benzerlik hesabından binlerce kat ucuz
+        # ve tekrarların ezici çoğunluğunu burada eler
+        seen_keys = set()
+        residual = []
         for i, qa_pair in enumerate(data):
             question = qa_pair.get('soru', '').strip().lower()
-            
+            key = ' '.join(sorted(question.split()))
+            if key in seen_keys:
+                duplicates.append(i)
+            else:
+                seen_keys.add(key)
+                residual.append((i, question))
+
+        # 2. katman: kalan sorularda bulanık benzerlik (0.8 <= sim < 1.0)
+        if MinHashLSH is not None:
+            # LSH index: her soru yalnızca aday komşularıyla karşılaştırılır,
+            # O(N^2) ikili Jaccard taraması ~O(N)'e düşer
+            lsh = MinHashLSH(threshold=0.8, num_perm=DEDUP_NUM_PERM)
+            for i, question in residual:
+                mh = MinHash(num_perm=DEDUP_NUM_PERM)
+                for word in set(question.split()):
+                    mh.update(word.encode('utf-8'))
+                if lsh.query(mh):
+                    duplicates.append(i)
+                else:
+                    lsh.insert(str(i), mh)
+            duplicates.sort()
+            return duplicates
+
+        # datasketch yoksa eski ikili tarama
+        seen_questions = {}
+        for i, question in residual:
             # Benzer soruları tespit et (Levenshtein benzeri basit kontrol)
             for seen_q, seen_idx in seen_questions.items():
                 similarity = self.calculate_similarity(question, seen_q)
@@ -203,7 +373,8 @@ class DataCleaner:
                     break
             else:
                 seen_questions[question] = i
-        
+
+        duplicates.sort()
         return duplicates
 
     def calculate_similarity(self, text1: str, text2: str) -> float:
@@ -219,14 +390,20 @@ class DataCleaner:
         
         return len(intersection) / len(union)
 
-    def clean_data(self, data: List[Dict]) -> Tuple[List[Dict], Dict]:
-        """Verileri temizler ve istatistikleri döndürür"""
+    def clean_data(self, data) -> Tuple[List[Dict], Dict]:
+        """Verileri temizler ve istatistikleri döndürür.
+
+        `data` liste olmak zorunda değildir: stream_load_data gibi bir
+        iterable verilirse çiftler tek tek tüketilir ve yalnızca kalite
+        kontrollerini geçenler bellekte tutulur.
+        """
         print("\n🧹 Veri temizleme başlatılıyor...")
-        
-        original_count = len(data)
+
+        # Akış girdisinde toplam sayı ancak geçiş bittiğinde bilinir
+        original_count = len(data) if isinstance(data, list) else None
         cleaned_data = []
         stats = {
-            'original_count': original_count,
+            'original_count': original_count or 0,
             'basic_quality_failed': 0,
             'content_quality_failed': 0,
             'semantic_quality_failed': 0,
@@ -235,48 +412,81 @@ class DataCleaner:
             'issues_summary': Counter()
         }
         
-        # Temel kalite kontrolü
-        print("1️⃣ Temel kalite kontrolü yapılıyor...")
-        temp_data = []
-        for i, qa_pair in enumerate(data):
-            is_valid, issues = self.check_basic_quality(qa_pair)
-            if is_valid:
-                temp_data.append(qa_pair)
-            else:
-                stats['basic_quality_failed'] += 1
-                for issue in issues:
-                    stats['issues_summary'][issue] += 1
-        
-        print(f"   ✅ {len(temp_data)}/{original_count} çift temel kalite kontrolünü geçti")
-        
-        # İçerik kalite kontrolü
-        print("2️⃣ İçerik kalite kontrolü yapılıyor...")
-        temp_data2 = []
-        for qa_pair in temp_data:
-            is_valid, issues = self.check_content_quality(qa_pair)
-            if is_valid:
-                temp_data2.append(qa_pair)
-            else:
+        # Üç kalite kontrolü tek geçişte: temp_data/2/3 ara listeleri
+        # (3N slot) kalkar, her çift ilk hatada kısa devre yapar - temel
+        # kontrolü geçemeyenler pahalı regex/semantik aşamalara hiç girmez
+        print("1️⃣2️⃣3️⃣ Kalite kontrolleri yapılıyor (tek geçiş)...")
+
+        # pandas varsa temel aşama vektörize ön filtre olarak koşar;
+        # döngüye yalnızca onu geçen çiftler girer
+        basic_done = False
+        if pd is not None and isinstance(data, list) and data:
+            data = self._prefilter_basic(data, stats)
+            basic_done = True
+
+        temp_data3 = []
+        issues_summary = stats['issues_summary']
+
+        if isinstance(data, list) and len(data) >= PARALLEL_MIN_ITEMS:
+            # Büyük veri: çiftler core'lara dağıtılır (sıralı imap,
+            # chunk'lar halinde); küçük veri için süreç maliyeti değmez
+            checker = partial(_check_pair, skip_basic=basic_done)
+            with mp.Pool(initializer=_init_worker_cleaner) as pool:
+                for qa_pair, (stage, issues) in zip(
+                        data, pool.imap(checker, data, chunksize=1024)):
+                    if stage is None:
+                        temp_data3.append(qa_pair)
+                    else:
+                        stats[stage] += 1
+                        for issue in issues:
+                            issues_summary[issue] += 1
+            data = ()  # seri döngü atlanır
+
+        streamed = 0
+        for qa_pair in data:
+            streamed += 1
+            if not basic_done:
+                is_valid, issues = self.check_basic_quality(qa_pair)
+                if not is_valid:
+                    stats['basic_quality_failed'] += 1
+                    for issue in issues:
+                        issues_summary[issue] += 1
+                    continue
+
+            # lower/split her iki kontrol için BİR kez hesaplanır;
+            # aşamaların kendi içinde tekrar türetmesi engellenir
+            question = qa_pair['soru'].strip().lower()
+            answer = qa_pair['cevap'].strip().lower()
+            q_tokens = question.split()
+            a_tokens = answer.split()
+
+            is_valid, issues = self.check_content_quality(
+                qa_pair, question, answer, q_tokens, a_tokens)
+            if not is_valid:
                 stats['content_quality_failed'] += 1
                 for issue in issues:
-                    stats['issues_summary'][issue] += 1
-        
-        print(f"   ✅ {len(temp_data2)}/{len(temp_data)} çift içerik kalite kontrolünü geçti")
-        
-        # Anlamsal kalite kontrolü
-        print("3️⃣ Anlamsal kalite kontrolü yapılıyor...")
-        temp_data3 = []
-        for qa_pair in temp_data2:
-            is_valid, issues = self.check_semantic_quality(qa_pair)
-            if is_valid:
-                temp_data3.append(qa_pair)
-            else:
+                    issues_summary[issue] += 1
+                continue
+
+            is_valid, issues = self.check_semantic_quality(
+                qa_pair, question, answer, q_tokens, a_tokens)
+            if not is_valid:
                 stats['semantic_quality_failed'] += 1
                 for issue in issues:
-                    stats['issues_summary'][issue] += 1
-        
-        print(f"   ✅ {len(temp_data3)}/{len(temp_data2)} çift anlamsal kalite kontrolünü geçti")
-        
+                    issues_summary[issue] += 1
+                continue
+
+            temp_data3.append(qa_pair)
+
+        if original_count is None:
+            original_count = streamed
+            stats['original_count'] = original_count
+
+        print(f"   ✅ {len(temp_data3)}/{original_count} çift kalite kontrollerini geçti")
+        print(f"      (temel: {stats['basic_quality_failed']}, "
+              f"içerik: {stats['content_quality_failed']}, "
+              f"anlamsal: {stats['semantic_quality_failed']} elendi)")
+
         # Tekrar kontrolü
         print("4️⃣ Tekrar eden veriler tespit ediliyor...")
         duplicates = self.detect_duplicates(temp_data3)
@@ -296,8 +506,14 @@ class DataCleaner:
     def save_cleaned_data(self, data: List[Dict], output_file: str):
         """Temizlenmiş verileri kaydeder"""
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 1 MiB tampon: varsayılan 8 KiB'e göre ~128x daha az write()
+            if orjson is not None:
+                with open(output_file, 'wb', buffering=1 << 20) as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_file, 'w', encoding='utf-8',
+                          buffering=1 << 20) as f:
+                    json.dump(data, f, ensure_ascii=False, indent=2)
             print(f"✅ Temizlenmiş veriler '{output_file}' dosyasına kaydedildi")
         except Exception as e:
             print(f"❌ Veri kaydetme hatası: {e}")
@@ -321,6 +537,44 @@ class DataCleaner:
             for issue, count in stats['issues_summary'].most_common(10):
                 print(f"  • {issue}: {count} kez")
 
+# Worker süreci başına tek DataCleaner: regex derlemeleri her chunk için
+# değil initializer'da bir kez yapılır
+_worker_cleaner = None
+
+def _init_worker_cleaner():
+    global _worker_cleaner
+    _worker_cleaner = DataCleaner()
+
+def _check_pair(qa_pair: Dict, skip_basic: bool = False):
+    """Bir çifte tüm kalite kontrollerini uygular.
+
+    (None, None) temiz demektir; aksi halde (başarısız aşama adı,
+    sorun listesi) döner. Çiftler arası bağımlılık olmadığından
+    multiprocessing.Pool ile güvenle paralelleştirilebilir.
+    """
+    cleaner = _worker_cleaner
+    if not skip_basic:
+        is_valid, issues = cleaner.check_basic_quality(qa_pair)
+        if not is_valid:
+            return 'basic_quality_failed', issues
+
+    question = qa_pair['soru'].strip().lower()
+    answer = qa_pair['cevap'].strip().lower()
+    q_tokens = question.split()
+    a_tokens = answer.split()
+
+    is_valid, issues = cleaner.check_content_quality(
+        qa_pair, question, answer, q_tokens, a_tokens)
+    if not is_valid:
+        return 'content_quality_failed', issues
+
+    is_valid, issues = cleaner.check_semantic_quality(
+        qa_pair, question, answer, q_tokens, a_tokens)
+    if not is_valid:
+        return 'semantic_quality_failed', issues
+
+    return None, None
+
 def main():
     """Ana fonksiyon"""
     print("🧹 Veri Temizleme Aracı")